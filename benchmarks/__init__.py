@@ -0,0 +1,43 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import time
+from typing import Callable
+
+__all__ = ["setup", "timeit"]
+
+
+def setup() -> None:
+    """Configure Django with the test settings and create the tables."""
+    import django
+    from django.core.management import call_command
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    django.setup()
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+
+def timeit(name: str, run: Callable[[], object], number: int) -> float:
+    """Print and return the mean seconds of run over number calls."""
+    run()
+    start = time.perf_counter()
+    for _ in range(number):
+        run()
+    mean = (time.perf_counter() - start) / number
+    print(f"{name:<32} {mean * 1e6:10.1f} us")
+    return mean
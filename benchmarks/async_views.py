@@ -0,0 +1,76 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+"""Sync against async menu views, under concurrent ASGI requests.
+
+Both menus route Book with LoginRequiredMixin and PermissionSnapshotMixin
+bases (tests/urls.py). Run from the repository root:
+python -m benchmarks.async_views
+"""
+
+import asyncio
+import time
+
+from benchmarks import setup
+
+setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.test import AsyncClient  # noqa: E402
+
+from tests.demo.models import Author, Book  # noqa: E402
+
+REQUESTS = 1000
+CONCURRENCY = 50
+
+
+async def measure(client: AsyncClient, path: str) -> float:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def get() -> None:
+        async with semaphore:
+            response = await client.get(path)
+            assert response.status_code == 200, response.status_code
+
+    await get()
+    start = time.perf_counter()
+    await asyncio.gather(*(get() for _ in range(REQUESTS)))
+    return REQUESTS / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    user = await get_user_model().objects.acreate(
+        username="bench", is_superuser=True
+    )
+    author = await Author.objects.acreate(name="ann")
+    await Book.objects.abulk_create(
+        Book(title=f"t{i}", author=author) for i in range(200)
+    )
+    book = await Book.objects.afirst()
+    assert book is not None
+
+    client = AsyncClient()
+    await client.aforce_login(user)
+    for view in ("list/", f"{book.pk}/detail/"):
+        for prefix in ("books", "abooks"):
+            path = f"/{prefix}/{view}"
+            rate = await measure(client, path)
+            print(f"{path:<24} {rate:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+"""get_form_class of a menu create view, memoized and rebuilt.
+
+Run from the repository root: python -m benchmarks.form_class
+"""
+
+from benchmarks import setup, timeit
+
+setup()
+
+from django.test import RequestFactory  # noqa: E402
+
+from nomos.views.generic.edit import CreateView  # noqa: E402
+from tests.demo.models import Book  # noqa: E402
+
+
+class BookCreateView(CreateView):
+    model = Book
+    fields = "__all__"
+
+
+class FreshBookCreateView(BookCreateView):
+    cache_form_class = False
+
+
+def form_class(view_class: type) -> object:
+    view = view_class()
+    view.setup(RequestFactory().get("/"))
+    return view.get_form_class()
+
+
+if __name__ == "__main__":
+    fresh = timeit("uncached", lambda: form_class(FreshBookCreateView), 2000)
+    cached = timeit("cached", lambda: form_class(BookCreateView), 2000)
+    print(f"speedup {fresh / cached:.0f}x")
@@ -0,0 +1,69 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+"""menu_patterns() for many models, eager and lazy view construction.
+
+Run from the repository root: python -m benchmarks.menu_startup [models]
+"""
+
+import sys
+from typing import List, Type
+
+from benchmarks import setup, timeit
+
+setup()
+
+from django.db import models  # noqa: E402
+
+from nomos.urls import menu_patterns  # noqa: E402
+from nomos.views.generic import menu as views_menu  # noqa: E402
+
+
+def make_models(count: int) -> List[Type[models.Model]]:
+    return [
+        type(
+            f"StartupModel{i}",
+            (models.Model,),
+            {
+                "__module__": __name__,
+                "name": models.CharField(max_length=50),
+                "Meta": type("Meta", (), {"app_label": "demo"}),
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def route(model_classes: List[Type[models.Model]], lazy: bool) -> None:
+    # a new process builds every menu again
+    views_menu._menuviews.clear()
+    for model in model_classes:
+        menu_patterns(
+            model, "models", model.__name__.lower(), "bench", lazy=lazy
+        )
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    model_classes = make_models(count)
+    eager = timeit(
+        f"eager, {count} models", lambda: route(model_classes, False), 5
+    )
+    lazy = timeit(
+        f"lazy, {count} models", lambda: route(model_classes, True), 5
+    )
+    print(f"speedup {eager / lazy:.0f}x")
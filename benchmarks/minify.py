@@ -0,0 +1,98 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+"""Rendered bytes and compile/render time with NOMOS_TEMPLATE_MINIFY.
+
+The models templates are loaded through the minify loader or not, with
+{% url %} replaced to render without routes; the Bulma form renders
+through AppDjangoTemplates.
+
+Run from the repository root: python -m benchmarks.minify
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks import setup, timeit
+
+setup()
+
+from django.template import Context, Engine  # noqa: E402
+from django.test import override_settings  # noqa: E402
+
+import nomos  # noqa: E402
+from nomos.contrib.bulma.forms import CharField, Form  # noqa: E402
+from nomos.forms.renderers import AppDjangoTemplates  # noqa: E402
+
+MODELS_TEMPLATES = Path(nomos.__file__).parent / "views/generic/templates"
+NAMES = ("detail.html", "list.html", "main.html")
+
+
+class BookForm(Form):
+    title = CharField()
+    subtitle = CharField(required=False)
+    author = CharField()
+    isbn = CharField(required=False)
+
+
+class View:
+    fieldvalues = [(f"field{i}", f"value {i}") for i in range(8)]
+    patterns = {"listurl": "/books/", "mainurl": "/"}
+
+
+def engine(minify: bool) -> Engine:
+    sources = {
+        name: (
+            (MODELS_TEMPLATES / "models" / name)
+            .read_text()
+            .replace("{% url ", "{% firstof ")
+        )
+        for name in NAMES
+    }
+    loaders: List[Any] = [("django.template.loaders.locmem.Loader", sources)]
+    if minify:
+        loaders = [("nomos.template.loaders.minify.Loader", loaders)]
+    return Engine(loaders=loaders)
+
+
+def bench(minify: bool) -> None:
+    label = "minified" if minify else "plain"
+    templates = engine(minify)
+    context: Dict[str, Any] = {
+        "view": View(),
+        "object_list": [f"Book {i}" for i in range(16)],
+    }
+    for name in NAMES:
+        template = templates.get_template(name)
+        size = len(template.render(Context(context)).encode())
+        print(f"{label} {name}: {size} bytes")
+        timeit(f"  compile {name}", lambda: templates.get_template(name), 2000)
+        timeit(
+            f"  render {name}",
+            lambda: template.render(Context(context)),
+            2000,
+        )
+
+    with override_settings(NOMOS_TEMPLATE_MINIFY=minify):
+        form = BookForm({"title": "Dune"}, renderer=AppDjangoTemplates())
+        print(f"{label} bulma form: {len(form.as_bulma_v().encode())} bytes")
+        timeit("  render bulma form", form.as_bulma_v, 2000)
+
+
+if __name__ == "__main__":
+    bench(False)
+    bench(True)
@@ -0,0 +1,29 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django.apps import AppConfig
+
+
+class Nomos(AppConfig):
+    name = "nomos"
+    default_auto_field = "django.db.models.BigAutoField"
+    verbose_name = "Nomos"
+
+    def ready(self) -> None:
+        from .shortcuts import track_permissions
+
+        track_permissions()
@@ -0,0 +1,218 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from django.conf import settings
+from django.forms.renderers import BaseRenderer
+from django.template import Template, Variable, VariableDoesNotExist
+from django.template.base import FilterExpression, TextNode, VariableNode
+from django.template.defaulttags import ForNode
+from django.utils.formats import localize
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeData, SafeString, mark_safe
+from django.utils.timezone import template_localtime
+
+__all__ = [
+    "fast_render",
+    "render_value",
+    "stringformat_s",
+    "render_attrs",
+    "render_plan",
+    "source_tail",
+    "ATTRS_TEMPLATE",
+    "ATTRS_SOURCE",
+    "OPTION_SOURCE",
+]
+
+ATTRS_TEMPLATE = "django/forms/widgets/attrs.html"
+ATTRS_SOURCE = (
+    "{% for name, value in widget.attrs.items %}"
+    "{% if value is not False %} {{ name }}"
+    "{% if value is not True %}=\"{{ value|stringformat:'s' }}\""
+    "{% endif %}{% endif %}{% endfor %}"
+)
+OPTION_SOURCE = (
+    "<option value=\"{{ widget.value|stringformat:'s' }}\""
+    '{% include "django/forms/widgets/attrs.html" %}>'
+    "{{ widget.label }}</option>"
+)
+
+_Loop = Tuple[List[str], Variable, "_Steps"]
+_Steps = List[Union[str, Variable, _Loop]]
+
+_plans: WeakKeyDictionary[Template, Optional[_Steps]] = WeakKeyDictionary()
+_tails: WeakKeyDictionary[Template, Optional[str]] = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def fast_render() -> bool:
+    return bool(getattr(settings, "NOMOS_BULMA_FAST_RENDER", False))
+
+
+def render_value(value: Any) -> str:
+    """Render a value as a VariableNode of an autoescaping template."""
+    value = localize(template_localtime(value))
+    if not issubclass(type(value), str):
+        value = str(value)
+    return conditional_escape(value)
+
+
+def stringformat_s(value: Any) -> str:
+    """Render {{ value|stringformat:'s' }}."""
+    formatted = str(value) if isinstance(value, tuple) else value
+    try:
+        result = "%s" % formatted
+    except (ValueError, TypeError):
+        result = ""
+    return render_value(
+        mark_safe(result) if isinstance(value, SafeData) else result
+    )
+
+
+def render_attrs(attrs: Dict[str, Any]) -> str:
+    """Render django/forms/widgets/attrs.html."""
+    html = []
+    for name, value in attrs.items():
+        if value is not False:
+            html.append(f" {render_value(name)}")
+            if value is not True:
+                html.append(f'="{stringformat_s(value)}"')
+    return "".join(html)
+
+
+def source_tail(
+    renderer: BaseRenderer, template_name: str, source: str
+) -> Optional[str]:
+    """The whitespace ending a template with the given source, or None.
+
+    The fast renderers mirror known templates only. Overridden templates
+    return None, and loaders may have changed the trailing whitespace.
+    """
+    template = __template(renderer, template_name)
+    tail: Optional[str]
+    try:
+        return _tails[template]
+    except KeyError:
+        pass
+
+    head, _, tail = template.source.partition(source)
+    if head or tail.strip():
+        tail = None
+
+    with _lock:
+        _tails[template] = tail
+    return tail
+
+
+def render_plan(
+    renderer: BaseRenderer, template_name: str, context: Dict[str, Any]
+) -> Optional[SafeString]:
+    """Render a template made of text, plain variables and for loops.
+
+    Returns None when the template uses anything else.
+    """
+    template = __template(renderer, template_name)
+    try:
+        steps = _plans[template]
+    except KeyError:
+        steps = (
+            __compile(template.nodelist)
+            if template.engine.autoescape
+            else None
+        )
+        with _lock:
+            _plans[template] = steps
+
+    if steps is None:
+        return None
+
+    html: List[str] = []
+    __run(steps, context, template.engine.string_if_invalid, html)
+    return mark_safe("".join(html))
+
+
+def __template(renderer: BaseRenderer, template_name: str) -> Template:
+    return renderer.get_template(template_name).template
+
+
+def __compile(nodes: Any) -> Optional[_Steps]:
+    steps: _Steps = []
+    for node in nodes:
+        if isinstance(node, TextNode):
+            steps.append(node.s)
+        elif isinstance(node, VariableNode):
+            var = __plain_variable(node.filter_expression)
+            if var is None:
+                return None
+            steps.append(var)
+        elif isinstance(node, ForNode):
+            sequence = __plain_variable(node.sequence)
+            body = __compile(node.nodelist_loop)
+            if (
+                sequence is None
+                or body is None
+                or node.is_reversed
+                or node.nodelist_empty
+            ):
+                return None
+            steps.append((list(node.loopvars), sequence, body))
+        else:
+            return None
+    return steps
+
+
+def __plain_variable(expression: FilterExpression) -> Optional[Variable]:
+    var = expression.var
+    if (
+        expression.filters
+        or not isinstance(var, Variable)
+        or var.lookups is None
+        or var.lookups[0] == "forloop"
+    ):
+        return None
+    return var
+
+
+def __run(
+    steps: _Steps,
+    context: Dict[str, Any],
+    string_if_invalid: str,
+    html: List[str],
+) -> None:
+    for step in steps:
+        if isinstance(step, str):
+            html.append(step)
+        elif isinstance(step, Variable):
+            try:
+                html.append(render_value(step.resolve(context)))
+            except VariableDoesNotExist:
+                html.append(render_value(string_if_invalid))
+        else:
+            loopvars, sequence, body = step
+            try:
+                values = sequence.resolve(context)
+            except VariableDoesNotExist:
+                values = None
+            for item in values or ():
+                if len(loopvars) == 1:
+                    scope = {loopvars[0]: item}
+                else:
+                    scope = dict(zip(loopvars, item))
+                __run(body, {**context, **scope}, string_if_invalid, html)
@@ -15,9 +15,12 @@
 # You should have received a copy of the GNU General Public License along
 # with Nomos. If not, see <https://www.gnu.org/licenses/>.
 
+from typing import Any, Dict, List, Optional
+
 from django import forms as djforms
+from django.forms.renderers import BaseRenderer
 
-from . import mixins
+from . import fast, mixins
 
 __all__ = ("Form", "CharField", "ModelChoiceField", "TextInput", "Select")
 
@@ -35,6 +38,35 @@ class TextInput(mixins.WidgetMixin, djforms.TextInput):
         "{% endif %}"
         '{% include "django/forms/widgets/attrs.html" %}>'
     )
+    fast_template_str = template_str
+
+    def RenderFast(
+        self, widget: Dict[str, Any], renderer: BaseRenderer
+    ) -> Optional[str]:
+        attrs_tail = fast.source_tail(
+            renderer, fast.ATTRS_TEMPLATE, fast.ATTRS_SOURCE
+        )
+        if attrs_tail is None:
+            return None
+
+        value = widget["value"]
+        return "".join(
+            (
+                (
+                    '<input class="input"'
+                    f' type="{fast.render_value(widget["type"])}"'
+                ),
+                f' name="{fast.render_value(widget["name"])}"',
+                (
+                    f' value="{fast.stringformat_s(value)}"'
+                    if value is not None
+                    else ""
+                ),
+                fast.render_attrs(widget["attrs"]),
+                attrs_tail,
+                ">",
+            )
+        )
 
 
 class Select(mixins.WidgetMixin, djforms.Select):
@@ -56,6 +88,52 @@ class Select(mixins.WidgetMixin, djforms.Select):
         "</select>"
         "</div>"
     )
+    fast_template_str = template_str
+
+    def RenderFast(
+        self, widget: Dict[str, Any], renderer: BaseRenderer
+    ) -> Optional[str]:
+        attrs_tail = fast.source_tail(
+            renderer, fast.ATTRS_TEMPLATE, fast.ATTRS_SOURCE
+        )
+        option_tail = fast.source_tail(
+            renderer, self.option_template_name, fast.OPTION_SOURCE
+        )
+        if attrs_tail is None or option_tail is None:
+            return None
+
+        html: List[str] = [
+            '<div class="select is-fullwidth">',
+            f'<select name="{fast.render_value(widget["name"])}"',
+            fast.render_attrs(widget["attrs"]),
+            attrs_tail,
+            ">",
+        ]
+        for group_name, group_choices, _ in widget["optgroups"]:
+            if group_name:
+                html.append(
+                    f'<optgroup label="{fast.render_value(group_name)}">'
+                )
+            for option in group_choices:
+                if option["template_name"] != self.option_template_name:
+                    return None
+                html.extend(
+                    (
+                        '<option value="',
+                        fast.stringformat_s(option["value"]),
+                        '"',
+                        fast.render_attrs(option["attrs"]),
+                        attrs_tail,
+                        ">",
+                        fast.render_value(option["label"]),
+                        "</option>",
+                        option_tail,
+                    )
+                )
+            if group_name:
+                html.append("</optgroup>")
+        html.append("</select></div>")
+        return "".join(html)
 
 
 class CharField(djforms.CharField):
@@ -15,21 +15,102 @@
 # You should have received a copy of the GNU General Public License along
 # with Nomos. If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, cast
+import threading
+from typing import Any, Dict, Optional, Tuple, cast
+from weakref import WeakKeyDictionary
 
-from django.forms.renderers import DjangoTemplates
+from django.forms.renderers import BaseRenderer, DjangoTemplates
 from django.forms.utils import RenderableMixin
+from django.template.backends.base import BaseEngine
+from django.template.backends.django import Template
+from django.utils.safestring import mark_safe
 
-__all__ = ["BulmaRenderableMixin"]
+from . import fast
+
+__all__ = ["BulmaRenderableMixin", "WidgetTemplateCache", "widget_templates"]
 
 
 class BulmaRenderableMixin(RenderableMixin):
+    template_name_bulma_v = "nomos/bulma/form_v.html"
+
     def as_bulma_v(self) -> str:
-        return cast(str, self.render("nomos/bulma/form_v.html"))
+        if fast.fast_render():
+            html = fast.render_plan(
+                cast(Any, self).renderer,
+                self.template_name_bulma_v,
+                self.get_context(),
+            )
+            if html is not None:
+                # as BaseRenderer.render does
+                return mark_safe(html.strip())
+        return cast(str, self.render(self.template_name_bulma_v))
+
+
+class WidgetTemplateCache:
+    """Compiled widget templates by engine and widget class."""
+
+    __slots__ = "hits", "misses", "__templates", "__lock"
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.__templates: WeakKeyDictionary[
+            BaseEngine, Dict[type, Tuple[str, Template]]
+        ] = WeakKeyDictionary()
+        self.__lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(hits={self.hits},"
+            f" misses={self.misses}, size={len(self)})"
+        )
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return sum(len(t) for t in self.__templates.values())
+
+    def Get(
+        self, engine: BaseEngine, widget_class: type, template_str: str
+    ) -> Template:
+        with self.__lock:
+            templates = self.__templates.get(engine)
+            if templates is None:
+                templates = self.__templates[engine] = {}
+            entry = templates.get(widget_class)
+            if entry is not None and entry[0] == template_str:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        template = cast(Template, engine.from_string(template_str))
+
+        with self.__lock:
+            templates[widget_class] = (template_str, template)
+        return template
+
+    def Clear(self) -> None:
+        with self.__lock:
+            self.__templates.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+widget_templates = WidgetTemplateCache()
 
 
 class WidgetMixin:
     template_str = ""
+    fast_template_str: Optional[str] = None
+
+    def RenderFast(
+        self, widget: Dict[str, Any], renderer: BaseRenderer
+    ) -> Optional[str]:
+        """Build the widget HTML without templates, None to use them.
+
+        Used with NOMOS_BULMA_FAST_RENDER while template_str is still
+        fast_template_str, and must match the template output byte by byte.
+        """
+        return None
 
     def _render(
         self,
@@ -37,5 +118,12 @@ class WidgetMixin:
         context: Dict[str, Any],
         renderer: DjangoTemplates,
     ) -> str:
-        template = renderer.engine.from_string(self.template_str)
+        if fast.fast_render() and self.fast_template_str == self.template_str:
+            html = self.RenderFast(context["widget"], renderer)
+            if html is not None:
+                return mark_safe(html)
+
+        template = widget_templates.Get(
+            renderer.engine, self.__class__, self.template_str
+        )
         return cast(str, template.render(context))
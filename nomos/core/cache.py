@@ -0,0 +1,126 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import time
+from typing import Any, List, Type
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db.models import Model, signals
+
+__all__ = [
+    "nomos_cache",
+    "model_version",
+    "bump_model_version",
+    "named_version",
+    "bump_named_version",
+    "track_model",
+    "related_models",
+]
+
+
+def nomos_cache() -> BaseCache:
+    return caches[getattr(settings, "NOMOS_CACHE", "default")]
+
+
+def model_version(model: Type[Model]) -> int:
+    """Current cache version of model, changed on every write to it.
+
+    Versions start at a nanosecond timestamp, so a version key lost to
+    eviction never brings back entries stored under an older version.
+    """
+    return __Version(__VersionKey(model))
+
+
+def bump_model_version(model: Type[Model]) -> None:
+    __Bump(__VersionKey(model))
+
+
+def named_version(name: str) -> int:
+    """Current cache version of name, as model_version."""
+    return __Version(f"nomos:version:{name}")
+
+
+def bump_named_version(name: str) -> None:
+    __Bump(f"nomos:version:{name}")
+
+
+def track_model(model: Type[Model]) -> None:
+    """Bump the version of model on save, delete and m2m changes."""
+    uid = f"nomos.version.{model._meta.label}"
+    signals.post_save.connect(
+        __BumpSender, sender=model, weak=False, dispatch_uid=uid
+    )
+    signals.post_delete.connect(
+        __BumpSender, sender=model, weak=False, dispatch_uid=uid
+    )
+    for field in model._meta.many_to_many:
+        through = getattr(field.remote_field, "through", None)
+        if isinstance(through, type):
+            signals.m2m_changed.connect(
+                __BumpInstance, sender=through, weak=False, dispatch_uid=uid
+            )
+
+
+def related_models(model: Type[Model]) -> List[Type[Model]]:
+    """model and the models of its forward ForeignKey and OneToOneField."""
+    models = [model]
+    for field in model._meta.fields:
+        related = field.related_model
+        if (
+            (field.many_to_one or field.one_to_one)
+            and isinstance(related, type)
+            and related not in models
+        ):
+            models.append(related)
+    return models
+
+
+def __BumpSender(sender: Type[Model], **kwargs: Any) -> None:
+    bump_model_version(sender)
+
+
+def __BumpInstance(
+    sender: Type[Model], instance: Model, **kwargs: Any
+) -> None:
+    bump_model_version(instance.__class__)
+    model = kwargs.get("model")
+    if isinstance(model, type):
+        bump_model_version(model)
+
+
+def __Version(key: str) -> int:
+    cache = nomos_cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key, 0)
+    return int(version)
+
+
+def __Bump(key: str) -> None:
+    cache = nomos_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def __VersionKey(model: Type[Model]) -> str:
+    return f"nomos:version:{model._meta.label_lower}"
@@ -0,0 +1,363 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime, time
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union, cast
+
+from django.conf import settings
+from django.core.exceptions import (
+    EmptyResultSet,
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Field, Model, Q, QuerySet
+from django.utils.functional import cached_property
+
+from .cache import model_version, nomos_cache
+
+__all__ = [
+    "KeysetPaginator",
+    "KeysetPage",
+    "InvalidCursor",
+    "CachedCountPaginator",
+    "EstimatedCountPaginator",
+    "UncountedPaginator",
+    "count_paginators",
+]
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class KeysetPaginator:
+    """Seek pagination over an ordering ended by a unique key.
+
+    Cursors encode the ordering values of the boundary row, so pages keep
+    their place under concurrent inserts and never run OFFSET or COUNT.
+    Ordering fields must be non-null concrete fields of the model; their
+    values travel at full precision and are parsed back by the fields.
+    """
+
+    def __init__(
+        self,
+        object_list: QuerySet[Model],
+        per_page: int,
+        ordering: Sequence[str] = (),
+    ) -> None:
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = self.__Ordering(object_list.model, ordering)
+
+    def page(self, cursor: Optional[str] = None) -> KeysetPage:
+        if not cursor:
+            rows = list(self.__Ordered(False)[: self.per_page + 1])
+            return KeysetPage(
+                rows[: self.per_page], self, len(rows) > self.per_page, False
+            )
+
+        backwards, values = self.__Decode(cursor)
+        queryset = self.__Ordered(backwards).filter(
+            self.__Seek(values, backwards)
+        )
+        rows = list(queryset[: self.per_page + 1])
+        more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if backwards:
+            rows.reverse()
+            return KeysetPage(rows, self, True, more)
+        return KeysetPage(rows, self, more, True)
+
+    def Cursor(self, obj: Model, backwards: bool) -> str:
+        values = [
+            self.__Encode(getattr(obj, field.attname))
+            for field, _ in self.ordering
+        ]
+        data = json.dumps([int(backwards), values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def __Decode(self, cursor: str) -> Tuple[bool, List[Any]]:
+        try:
+            data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            backwards, values = json.loads(data)
+        except (binascii.Error, ValueError, TypeError) as error:
+            raise InvalidCursor("Malformed cursor") from error
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidCursor("Cursor does not match the ordering")
+        try:
+            values = [
+                field.to_python(value)
+                for (field, _), value in zip(self.ordering, values)
+            ]
+        except ValidationError as error:
+            raise InvalidCursor("Invalid cursor value") from error
+        return bool(backwards), values
+
+    @staticmethod
+    def __Encode(value: Any) -> Any:
+        if isinstance(value, (datetime, time)):
+            return value.isoformat(timespec="microseconds")
+        if isinstance(value, date):
+            return value.isoformat()
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        return str(value)
+
+    def __Ordered(self, backwards: bool) -> QuerySet[Model]:
+        return self.object_list.order_by(
+            *(
+                f"{'-' if descending != backwards else ''}{field.attname}"
+                for field, descending in self.ordering
+            )
+        )
+
+    def __Seek(self, values: List[Any], backwards: bool) -> Q:
+        seek = Q()
+        for i, (field, descending) in enumerate(self.ordering):
+            lookup = "lt" if descending != backwards else "gt"
+            step = Q(**{f"{field.attname}__{lookup}": values[i]})
+            for j in range(i):
+                step &= Q(**{self.ordering[j][0].attname: values[j]})
+            seek |= step
+        return seek
+
+    @staticmethod
+    def __Ordering(
+        model: Type[Model], ordering: Sequence[str]
+    ) -> Tuple[Tuple[Field[Any, Any], bool], ...]:
+        opts = model._meta
+        if opts.pk is None:
+            raise ImproperlyConfigured("Keyset pagination requires a pk")
+
+        keys: List[Tuple[Field[Any, Any], bool]] = []
+        for name in ordering:
+            descending = name.startswith("-")
+            name = name.lstrip("-")
+            try:
+                if not name or name == "?" or "__" in name:
+                    raise FieldDoesNotExist(name)
+                field = opts.pk if name == "pk" else opts.get_field(name)
+            except FieldDoesNotExist:
+                field = None
+            if not getattr(field, "concrete", False):
+                raise ImproperlyConfigured(
+                    f"Unsupported keyset ordering field '{name}'"
+                )
+            field = cast(Field[Any, Any], field)
+            keys.append((field, descending))
+            if field.unique:
+                break
+        else:
+            descending = keys[-1][1] if keys else False
+            keys.append((opts.pk, descending))
+
+        return tuple(keys)
+
+
+class KeysetPage:
+    def __init__(
+        self,
+        object_list: List[Model],
+        paginator: KeysetPaginator,
+        has_next: bool,
+        has_previous: bool,
+    ) -> None:
+        self.object_list = object_list
+        self.paginator = paginator
+        self.__has_next = has_next and bool(object_list)
+        self.__has_previous = has_previous and bool(object_list)
+
+    def __repr__(self) -> str:
+        return f"<KeysetPage of {len(self.object_list)} objects>"
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __getitem__(self, index: int) -> Model:
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.__has_next
+
+    def has_previous(self) -> bool:
+        return self.__has_previous
+
+    def has_other_pages(self) -> bool:
+        return self.__has_next or self.__has_previous
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        if not self.__has_next:
+            return None
+        return self.paginator.Cursor(self.object_list[-1], False)
+
+    @property
+    def previous_cursor(self) -> Optional[str]:
+        if not self.__has_previous:
+            return None
+        return self.paginator.Cursor(self.object_list[0], True)
+
+
+class CachedCountPaginator(Paginator):
+    """Exact count kept in the cache for count_timeout seconds.
+
+    Entries are keyed by the model version, so saving or deleting any
+    object of the model invalidates them once track_model(model) has run
+    (menu_patterns does it for count_strategy "cached").
+    """
+
+    count_timeout = getattr(settings, "NOMOS_COUNT_TIMEOUT", 300)
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return super().count
+
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+
+        model = queryset.model
+        digest = hashlib.sha1(
+            f"{queryset.db}:{sql}:{params!r}".encode()
+        ).hexdigest()
+        key = (
+            f"nomos:count:{model._meta.label_lower}:{model_version(model)}:"
+            f"{digest}"
+        )
+        return int(
+            nomos_cache().get_or_set(key, queryset.count, self.count_timeout)
+        )
+
+
+class EstimatedCountPaginator(Paginator):
+    """Row estimate from the database statistics for unfiltered lists.
+
+    Filtered querysets, backends without statistics (SQLite) and tables
+    smaller than estimate_threshold fall back to the exact count.
+    """
+
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            estimate = self.__Estimate(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
+
+    @staticmethod
+    def __Estimate(queryset: QuerySet[Model]) -> Optional[int]:
+        connection = connections[queryset.db]
+        table = queryset.model._meta.db_table
+
+        if connection.vendor == "postgresql":
+            sql = (
+                "SELECT reltuples::bigint FROM pg_class WHERE oid ="
+                " %s::regclass"
+            )
+            params = [connection.ops.quote_name(table)]
+        elif connection.vendor == "mysql":
+            sql = (
+                "SELECT table_rows FROM information_schema.tables"
+                " WHERE table_schema = DATABASE() AND table_name = %s"
+            )
+            params = [table]
+        else:
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+
+        if row is None or row[0] is None or row[0] < 0:
+            return None
+        return int(row[0])
+
+
+class UncountedPaginator(Paginator):
+    """Pages without COUNT(*): fetches one extra row to detect a next page.
+
+    count and num_pages still run the exact count if something asks for
+    them, like a last-page link.
+    """
+
+    def validate_number(self, number: Union[int, float, str]) -> int:
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError) as error:
+            raise PageNotAnInteger(
+                "That page number is not an integer"
+            ) from error
+        if number < 1:
+            raise EmptyPage("That page number is less than 1")
+        return number
+
+    def page(self, number: Union[int, float, str]) -> Page:
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page + 1
+        rows = list(self.object_list[bottom:top])
+        if not rows and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage("That page contains no results")
+        return UncountedPage(
+            rows[: self.per_page], number, self, len(rows) > self.per_page
+        )
+
+
+class UncountedPage(Page):
+    def __init__(
+        self,
+        object_list: List[Any],
+        number: int,
+        paginator: Paginator,
+        has_next: bool,
+    ) -> None:
+        super().__init__(object_list, number, paginator)
+        self.__has_next = has_next
+
+    def has_next(self) -> bool:
+        return self.__has_next
+
+    def end_index(self) -> int:
+        return (self.number - 1) * self.paginator.per_page + len(
+            self.object_list
+        )
+
+
+count_paginators = {
+    "exact": Paginator,
+    "cached": CachedCountPaginator,
+    "estimated": EstimatedCountPaginator,
+    "none": UncountedPaginator,
+}
@@ -0,0 +1,381 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import pickle
+import uuid
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core import signing
+from django.core.files.base import File
+from django.db import connections, router
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+
+from .cache import nomos_cache
+
+__all__ = [
+    "SequenceExpired",
+    "SequenceStorage",
+    "SessionSequenceStorage",
+    "CacheSequenceStorage",
+    "CookieSequenceStorage",
+    "DatabaseSequenceStorage",
+    "clear_expired_sequences",
+]
+
+
+class SequenceExpired(Exception):
+    pass
+
+
+class SequenceStorage:
+    """State of a multi-step sequence, written one step delta at a time.
+
+    Load() returns the accumulated values, Update() writes only the given
+    names, and Save() runs once the response exists. The state expires
+    ttl seconds after the last write.
+    """
+
+    def __init__(self, request: HttpRequest, name: str, ttl: int) -> None:
+        self.request = request
+        self.name = name
+        self.ttl = ttl
+        self._values: Optional[Dict[str, Any]] = None
+
+    def Load(self) -> Dict[str, Any]:
+        if self._values is None:
+            self._values = self.Read()
+        return self._values
+
+    def Update(self, delta: Dict[str, Any]) -> None:
+        values = self.Load()
+        changed = {
+            name: value
+            for name, value in delta.items()
+            if name not in values or values[name] != value
+        }
+        if changed:
+            values.update(changed)
+            self.Write(changed)
+
+    def Clear(self) -> None:
+        self._values = {}
+        self.Delete()
+
+    def Save(self, response: HttpResponse) -> None:
+        pass
+
+    def Read(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def Write(self, delta: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def Delete(self) -> None:
+        raise NotImplementedError
+
+
+class SessionSequenceStorage(SequenceStorage):
+    """Keeps the values in the session. With NOMOS_SEQUENCE_INLINE_MAX
+    set, binary values and values larger than that many bytes pickled go
+    to a DatabaseSequenceStorage, whose value names the session keeps.
+
+    Values must be picklable. Files are rejected, store them first and
+    keep their names instead.
+    """
+
+    def __init__(self, request: HttpRequest, name: str, ttl: int) -> None:
+        super().__init__(request, name, ttl)
+        self.__spill = DatabaseSequenceStorage(request, f"{name}:spilled", ttl)
+
+    def Read(self) -> Dict[str, Any]:
+        stored = self.request.session.get(self.name, {})
+        spilled = stored.get("_spilled", ())
+        values = {k: v for k, v in stored.items() if k != "_spilled"}
+        if spilled:
+            found = self.__spill.Read()
+            missing = [name for name in spilled if name not in found]
+            if missing:
+                raise SequenceExpired(
+                    f"Values {', '.join(missing)} of sequence {self.name}"
+                    " expired or were removed."
+                )
+            values.update((name, found[name]) for name in spilled)
+        return values
+
+    def Write(self, delta: Dict[str, Any]) -> None:
+        stored = dict(self.request.session.get(self.name, {}))
+        spilled = set(stored.pop("_spilled", ()))
+        limit = getattr(settings, "NOMOS_SEQUENCE_INLINE_MAX", None)
+
+        large = {}
+        for name, value in delta.items():
+            if self.__IsLarge(name, value, limit):
+                spilled.add(name)
+                large[name] = value
+                stored.pop(name, None)
+            else:
+                stored[name] = value
+                spilled.discard(name)
+
+        if spilled:
+            # also renews the ttl of the values spilled before
+            self.__spill.Write(large)
+            stored["_spilled"] = sorted(spilled)
+        self.request.session[self.name] = stored
+
+    def Delete(self) -> None:
+        self.request.session.pop(self.name, None)
+        self.__spill.Delete()
+
+    def __IsLarge(self, name: str, value: Any, limit: Optional[int]) -> bool:
+        if isinstance(value, File):
+            raise TypeError(
+                f"Value {name} of sequence {self.name} is a file, store it"
+                " and keep its name instead."
+            )
+        try:
+            size = len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        except Exception as error:
+            raise TypeError(
+                f"Value {name} of sequence {self.name} is not picklable."
+            ) from error
+        if limit is None:
+            return False
+        return size > limit or isinstance(
+            value, (bytes, bytearray, memoryview)
+        )
+
+
+class _SequenceIdMixin(SequenceStorage):
+    """Keeps only a sequence id in the session."""
+
+    def SequenceId(self, create: bool = False) -> Optional[str]:
+        sequence_id = self.request.session.get(self.name)
+        if sequence_id is None and create:
+            sequence_id = self.request.session[self.name] = uuid.uuid4().hex
+        return sequence_id
+
+
+class CacheSequenceStorage(_SequenceIdMixin):
+    """One cache entry per value, plus an index of the value names.
+
+    Each write renews the ttl of every value, and a value lost while the
+    index is still there raises SequenceExpired.
+    """
+
+    def Read(self) -> Dict[str, Any]:
+        sequence_id = self.SequenceId()
+        if sequence_id is None:
+            return {}
+
+        cache = nomos_cache()
+        names = cache.get(self.__Key(sequence_id), ())
+        found = cache.get_many([self.__Key(sequence_id, n) for n in names])
+        missing = [n for n in names if self.__Key(sequence_id, n) not in found]
+        if missing:
+            raise SequenceExpired(
+                f"Values {', '.join(missing)} of sequence {self.name}"
+                " expired or were evicted."
+            )
+        return {name: found[self.__Key(sequence_id, name)] for name in names}
+
+    def Write(self, delta: Dict[str, Any]) -> None:
+        sequence_id = self.SequenceId(create=True)
+        assert sequence_id is not None
+
+        cache = nomos_cache()
+        entries = {
+            self.__Key(sequence_id, name): value
+            for name, value in delta.items()
+        }
+        names = sorted(self.Load())
+        entries[self.__Key(sequence_id)] = names
+        cache.set_many(entries, self.ttl)
+        # the values of the earlier steps expire with the index
+        for name in names:
+            if name not in delta:
+                cache.touch(self.__Key(sequence_id, name), self.ttl)
+
+    def Delete(self) -> None:
+        sequence_id = self.SequenceId()
+        if sequence_id is None:
+            return
+
+        cache = nomos_cache()
+        index = self.__Key(sequence_id)
+        names = cache.get(index, ())
+        cache.delete_many(
+            [index, *(self.__Key(sequence_id, name) for name in names)]
+        )
+        self.request.session.pop(self.name, None)
+
+    @staticmethod
+    def __Key(sequence_id: str, name: Optional[str] = None) -> str:
+        key = f"nomos:seq:{sequence_id}"
+        return key if name is None else f"{key}:{name}"
+
+
+class CookieSequenceStorage(SequenceStorage):
+    """Keeps the values in a signed, compressed cookie.
+
+    Values must be JSON serializable, and the whole state travels with
+    every request, so it suits short sequences of small values.
+    """
+
+    salt = "nomos.sequence"
+
+    def __init__(self, request: HttpRequest, name: str, ttl: int) -> None:
+        super().__init__(request, name, ttl)
+        self.__dirty = False
+
+    def Read(self) -> Dict[str, Any]:
+        cookie = self.request.COOKIES.get(self.name)
+        if cookie is None:
+            return {}
+        try:
+            values = signing.loads(cookie, salt=self.salt, max_age=self.ttl)
+        except signing.BadSignature:
+            return {}
+        return values if isinstance(values, dict) else {}
+
+    def Write(self, delta: Dict[str, Any]) -> None:
+        self.__dirty = True
+
+    def Delete(self) -> None:
+        self.__dirty = True
+
+    def Save(self, response: HttpResponse) -> None:
+        if not self.__dirty:
+            return
+        values = self.Load()
+        if values:
+            response.set_cookie(
+                self.name,
+                signing.dumps(values, salt=self.salt, compress=True),
+                max_age=self.ttl,
+                httponly=True,
+                samesite="Lax",
+            )
+        else:
+            response.delete_cookie(self.name, samesite="Lax")
+
+
+class DatabaseSequenceStorage(_SequenceIdMixin):
+    """One SequenceValue row per value, upserted per step, with
+    update_or_create on backends without bulk_create upserts.
+
+    Values are pickled and signed with SECRET_KEY. Rows older than the
+    ttl are ignored and removed by clear_expired_sequences().
+    """
+
+    def Read(self) -> Dict[str, Any]:
+        from ..models import SequenceValue
+
+        sequence_id = self.SequenceId()
+        if sequence_id is None:
+            return {}
+
+        rows = SequenceValue.objects.filter(
+            sequence=sequence_id,
+            updated_at__gte=timezone.now() - timedelta(seconds=self.ttl),
+        ).values_list("name", "value")
+        values = {}
+        for name, value in rows:
+            try:
+                values[name] = _loads(bytes(value))
+            except ValueError:
+                continue
+        return values
+
+    def Write(self, delta: Dict[str, Any]) -> None:
+        from ..models import SequenceValue
+
+        sequence_id = self.SequenceId(create=True)
+        now = timezone.now()
+        SequenceValue.objects.filter(sequence=sequence_id).update(
+            updated_at=now
+        )
+        using = router.db_for_write(SequenceValue)
+        if not connections[
+            using
+        ].features.supports_update_conflicts_with_target:
+            for name, value in delta.items():
+                SequenceValue.objects.update_or_create(
+                    sequence=sequence_id,
+                    name=name,
+                    defaults={"value": _dumps(value), "updated_at": now},
+                )
+            return
+
+        SequenceValue.objects.bulk_create(
+            [
+                SequenceValue(
+                    sequence=sequence_id,
+                    name=name,
+                    value=_dumps(value),
+                    updated_at=now,
+                )
+                for name, value in delta.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["sequence", "name"],
+            update_fields=["value", "updated_at"],
+        )
+
+    def Delete(self) -> None:
+        from ..models import SequenceValue
+
+        sequence_id = self.SequenceId()
+        if sequence_id is not None:
+            SequenceValue.objects.filter(sequence=sequence_id).delete()
+            self.request.session.pop(self.name, None)
+
+
+def clear_expired_sequences(ttl: int) -> int:
+    """Delete the DatabaseSequenceStorage values older than ttl seconds."""
+    from ..models import SequenceValue
+
+    deleted, _ = SequenceValue.objects.filter(
+        updated_at__lt=timezone.now() - timedelta(seconds=ttl)
+    ).delete()
+    return deleted
+
+
+def _dumps(value: Any) -> bytes:
+    payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    return _sign(payload) + payload
+
+
+def _loads(data: bytes) -> Any:
+    digest, payload = data[:32], data[32:]
+    if not hmac.compare_digest(digest, _sign(payload)):
+        raise ValueError("Bad sequence value signature")
+    return pickle.loads(payload)
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(
+        force_bytes(settings.SECRET_KEY), payload, hashlib.sha256
+    ).digest()
@@ -0,0 +1,182 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import time
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, NamedTuple, Set
+
+from django.forms.renderers import get_default_renderer
+from django.template import TemplateDoesNotExist, loader
+from django.template.utils import get_app_template_dirs
+from django.urls import get_resolver
+
+from ..contrib.bulma.mixins import WidgetMixin, widget_templates
+from ..template import manifest
+from ..template.defaulttags import skey
+from ..views.generic.base import MixModelFormMixin, SharedFormClassMixin
+from ..views.generic.edit import CreateView
+from ..views.generic.menu import MenuViews, menuviews_registrations
+
+__all__ = [
+    "WarmupStep",
+    "warmup",
+    "warmup_views",
+    "warmup_forms",
+    "warmup_templates",
+    "warmup_widgets",
+    "warmup_skeys",
+]
+
+MENU_TEMPLATES_DIR = Path(__file__).parent.parent / "views/generic/templates"
+BULMA_TEMPLATES_DIR = Path(__file__).parent.parent / "contrib/bulma/templates"
+WIDGET_TEMPLATE_NAMES = (
+    "django/forms/widgets/attrs.html",
+    "django/forms/widgets/select_option.html",
+)
+
+
+class WarmupStep(NamedTuple):
+    name: str
+    items: int
+    seconds: float
+
+
+def warmup() -> List[WarmupStep]:
+    """Build what nomos would otherwise build lazily in every worker.
+
+    Meant to run before fork, so that the workers share the result.
+    """
+    steps: List[WarmupStep] = []
+    views: List[MenuViews] = []
+
+    def step(name: str, func: Callable[[], int]) -> None:
+        start = time.perf_counter()
+        items = func()
+        steps.append(WarmupStep(name, items, time.perf_counter() - start))
+
+    def build_views() -> int:
+        views.extend(warmup_views())
+        return len(views)
+
+    step("views", build_views)
+    step("forms", lambda: warmup_forms(views))
+    step("templates", lambda: warmup_templates(views))
+    step("widgets", warmup_widgets)
+    step("skeys", warmup_skeys)
+    return steps
+
+
+def warmup_views() -> List[MenuViews]:
+    """Import the urlconf and build the views of every menu_patterns."""
+    get_resolver().url_patterns
+    return [build() for build in menuviews_registrations()]
+
+
+def warmup_forms(views: Iterable[MenuViews]) -> int:
+    """Build the form classes that modelform_class shares.
+
+    Those of the menu create, update and import views.
+    """
+    count = 0
+    for view_class in __view_classes(views):
+        if issubclass(
+            view_class, (MixModelFormMixin, CreateView, SharedFormClassMixin)
+        ):
+            view_class().get_form_class()
+            count += 1
+    return count
+
+
+def warmup_templates(views: Iterable[MenuViews]) -> int:
+    """Compile the menu and Bulma templates into the cached loaders."""
+    names: Set[str] = {
+        view_class.template_name
+        for view_class in __view_classes(views)
+        if getattr(view_class, "template_name", None)
+    }
+    names.update(__template_names(MENU_TEMPLATES_DIR))
+
+    count = 0
+    for name in sorted(names):
+        try:
+            loader.get_template(name)
+        except TemplateDoesNotExist:
+            continue
+        count += 1
+
+    renderer = get_default_renderer()
+    for name in (
+        *__template_names(BULMA_TEMPLATES_DIR),
+        *WIDGET_TEMPLATE_NAMES,
+    ):
+        try:
+            renderer.get_template(name)
+        except TemplateDoesNotExist:
+            continue
+        count += 1
+    return count
+
+
+def warmup_widgets() -> int:
+    engine = getattr(get_default_renderer(), "engine", None)
+    if engine is None:
+        return 0
+
+    # project widgets come with their forms, the Bulma ones may not
+    import_module("nomos.contrib.bulma.forms")
+
+    count = 0
+    for widget_class in __subclasses(WidgetMixin):
+        if widget_class.template_str:
+            widget_templates.Get(
+                engine, widget_class, widget_class.template_str
+            )
+            count += 1
+    return count
+
+
+def warmup_skeys() -> int:
+    dirs = [*manifest.template_dirs(), *get_app_template_dirs("templates")]
+    names = manifest.find_skeys(dirs)
+    for name in names:
+        skey(name)
+    return len(names)
+
+
+def __view_classes(views: Iterable[MenuViews]) -> List[Any]:
+    return [
+        view_class
+        for menu in views
+        for view_class in menu
+        if view_class is not None
+    ]
+
+
+def __template_names(directory: Path) -> List[str]:
+    return [
+        path.relative_to(directory).as_posix()
+        for path in sorted(directory.rglob("*.html"))
+    ]
+
+
+def __subclasses(cls: type) -> List[type]:
+    found: List[type] = []
+    for subclass in cls.__subclasses__():
+        found.append(subclass)
+        found.extend(__subclasses(subclass))
+    return found
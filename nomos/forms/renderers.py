@@ -16,7 +16,9 @@
 # with Nomos. If not, see <https://www.gnu.org/licenses/>.
 
 from pathlib import Path
+from typing import Any, List
 
+from django.conf import settings
 from django.forms import renderers as form_renderers
 from django.template import Engine
 from django.utils.functional import cached_property
@@ -25,15 +27,23 @@ from django.utils.functional import cached_property
 class AppDjangoTemplates(form_renderers.DjangoTemplates):
     @cached_property
     def engine(self) -> Engine:
-        loaders = [
-            (
-                "django.template.loaders.cached.Loader",
-                [
-                    "django.template.loaders.app_directories.Loader",
-                    "django.template.loaders.filesystem.Loader",
-                ],
-            )
+        loaders: List[Any] = [
+            "django.template.loaders.app_directories.Loader",
+            "django.template.loaders.filesystem.Loader",
         ]
+        if getattr(settings, "NOMOS_TEMPLATE_MINIFY", False):
+            loaders = [("nomos.template.loaders.minify.Loader", loaders)]
+        cache_dir = getattr(settings, "NOMOS_TEMPLATE_CACHE_DIR", None)
+        if cache_dir is None:
+            loaders = [("django.template.loaders.cached.Loader", loaders)]
+        else:
+            loaders = [
+                (
+                    "nomos.template.loaders.persistent.Loader",
+                    loaders,
+                    cache_dir,
+                )
+            ]
         return self.backend(
             {
                 "APP_DIRS": False,
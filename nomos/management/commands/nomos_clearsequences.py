@@ -0,0 +1,42 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...core.sequence import clear_expired_sequences
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes the database-stored sequence values not written for the"
+        " ttl, by default settings.NOMOS_SEQUENCE_TTL."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--ttl",
+            type=int,
+            default=getattr(settings, "NOMOS_SEQUENCE_TTL", 86400),
+            help="Seconds since the last write of a sequence value.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        deleted = clear_expired_sequences(options["ttl"])
+        self.stdout.write(f"{deleted} expired sequence values deleted")
@@ -0,0 +1,72 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from ...template import manifest
+
+
+class Command(BaseCommand):
+    help = (
+        "Scans the template directories for nomos_sk usages and writes the"
+        " short-key manifest loaded by nomos.template.defaulttags."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "dirs",
+            nargs="*",
+            type=Path,
+            help="Template directories to scan besides the engine ones.",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            type=Path,
+            default=getattr(settings, "NOMOS_SK_MANIFEST", None),
+            help="Manifest path. Defaults to settings.NOMOS_SK_MANIFEST.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        output = options["output"]
+        if output is None:
+            raise CommandError(
+                "Set NOMOS_SK_MANIFEST or pass --output to write the manifest."
+            )
+
+        dirs = [*manifest.template_dirs(), *options["dirs"]]
+        names = manifest.find_skeys(dirs)
+        collisions = manifest.hash_collisions(names)
+        if collisions:
+            raise CommandError(
+                "Names sharing a hashed short key: "
+                + "; ".join(", ".join(group) for group in collisions)
+            )
+        manifest.dump_manifest(manifest.make_manifest(names), output)
+
+        self.stdout.write(
+            f"{len(names)} short keys from {len(dirs)} directories"
+            f" written to {output}"
+        )
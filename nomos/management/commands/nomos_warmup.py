@@ -0,0 +1,38 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from ...core.warmup import warmup
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs nomos.core.warmup.warmup() and reports the time of each step."
+        " Call warmup() in the preloaded WSGI/ASGI module to share the"
+        " result with the forked workers."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        total = 0.0
+        for step in warmup():
+            total += step.seconds
+            ms = step.seconds * 1000
+            self.stdout.write(f"{step.name:<10} {step.items:>6} {ms:9.1f} ms")
+        self.stdout.write(f"{'total':<10} {'':>6} {total * 1000:9.1f} ms")
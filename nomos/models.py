@@ -0,0 +1,39 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django.db import models
+
+__all__ = ["SequenceValue"]
+
+
+class SequenceValue(models.Model):
+    """A value of a multi-step sequence, see DatabaseSequenceStorage."""
+
+    sequence = models.UUIDField()
+    name = models.CharField(max_length=150)
+    value = models.BinaryField()
+    updated_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["sequence", "name"], name="nomos_sequence_value"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.sequence}:{self.name}"
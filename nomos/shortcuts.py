@@ -17,17 +17,32 @@
 
 from __future__ import annotations
 
-from typing import List, Type
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, List, Type
 
-from django.contrib.auth import get_permission_codename
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_permission_codename, get_user_model
+from django.core.exceptions import ImproperlyConfigured
 from django.db import models
+from django.db.models import signals
+from django.http import HttpRequest
 
-__all__ = ("PermissionNames",)
+from .core.cache import bump_named_version, named_version, nomos_cache
+
+__all__ = (
+    "PermissionNames",
+    "PermissionSnapshot",
+    "permission_snapshot",
+    "permissions_version",
+    "track_permissions",
+)
 
 
 class PermissionNames:
     __slots__ = "list", "create", "detail", "update", "delete"
 
+    __made: ClassVar[Dict[Type[models.Model], PermissionNames]] = {}
+
     def __init__(
         self,
         list: List[str],
@@ -51,6 +66,12 @@ class PermissionNames:
 
     @classmethod
     def Make(cls, model: Type[models.Model]) -> PermissionNames:
+        """The permission names of model, shared and not to be mutated."""
+        try:
+            return cls.__made[model]
+        except KeyError:
+            pass
+
         opts = model._meta
 
         add_permission = cls.__get_name(opts, "add")
@@ -58,13 +79,14 @@ class PermissionNames:
         delete_permission = cls.__get_name(opts, "delete")
         view_permission = cls.__get_name(opts, "view")
 
-        return PermissionNames(
+        names = PermissionNames(
             list=[view_permission],
             create=[add_permission],
             detail=[view_permission],
             update=[change_permission],
             delete=[delete_permission],
         )
+        return cls.__made.setdefault(model, names)
 
     @staticmethod
     def __get_name(
@@ -73,3 +95,111 @@ class PermissionNames:
         return ".".join(
             (opts.app_label, get_permission_codename(action, opts))
         )
+
+
+class PermissionSnapshot:
+    """The permissions of a user, loaded once and checked in memory."""
+
+    __slots__ = "permissions", "is_superuser"
+
+    def __init__(self, permissions: FrozenSet[str], is_superuser: bool):
+        self.permissions = permissions
+        self.is_superuser = is_superuser
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(permissions={len(self.permissions)},"
+            f" is_superuser={self.is_superuser})"
+        )
+
+    def has_perms(self, names: Iterable[str]) -> bool:
+        return self.is_superuser or all(
+            name in self.permissions for name in names
+        )
+
+    @classmethod
+    def Load(cls, user: Any) -> PermissionSnapshot:
+        """Load the permissions of user from the auth backends.
+
+        With NOMOS_PERMISSION_CACHE_TIMEOUT set, the permissions of
+        authenticated users are cached under permissions_version, so any
+        change to the groups or permissions of a user or group drops every
+        cached snapshot.
+        """
+        if user.is_active and user.is_superuser:
+            return cls(frozenset(), True)
+
+        timeout = getattr(settings, "NOMOS_PERMISSION_CACHE_TIMEOUT", None)
+        if timeout is None or user.pk is None:
+            return cls(frozenset(user.get_all_permissions()), False)
+
+        if not apps.is_installed("nomos"):
+            raise ImproperlyConfigured(
+                "NOMOS_PERMISSION_CACHE_TIMEOUT requires 'nomos' in"
+                " INSTALLED_APPS, which keeps the cache up to date."
+            )
+
+        key = (
+            f"nomos:perms:{user.pk}:{int(user.is_active)}:"
+            f"{permissions_version()}"
+        )
+        cache = nomos_cache()
+        permissions = cache.get(key)
+        if permissions is None:
+            permissions = sorted(user.get_all_permissions())
+            cache.set(key, permissions, timeout)
+        return cls(frozenset(permissions), False)
+
+
+def permission_snapshot(request: HttpRequest) -> PermissionSnapshot:
+    """The PermissionSnapshot of request.user, loaded once per request."""
+    snapshot = getattr(request, "_nomos_permission_snapshot", None)
+    if snapshot is None:
+        snapshot = PermissionSnapshot.Load(getattr(request, "user"))
+        setattr(request, "_nomos_permission_snapshot", snapshot)
+    return snapshot
+
+
+def permissions_version() -> int:
+    """Cache version of the permissions of every user."""
+    return named_version("permissions")
+
+
+def track_permissions() -> None:
+    """Bump permissions_version when the permissions of anyone change.
+
+    That is the user and group many-to-many fields to Group and
+    Permission, and Permission saves and Group or Permission deletes.
+    Other user saves, as the last_login update on each login, keep it.
+    """
+    from django.contrib.auth.models import Group, Permission
+
+    uid = "nomos.version.permissions"
+    for model in (get_user_model(), Group):
+        for field in model._meta.many_to_many:
+            through = getattr(field.remote_field, "through", None)
+            if field.related_model in (Group, Permission) and isinstance(
+                through, type
+            ):
+                signals.m2m_changed.connect(
+                    __BumpPermissionsChanged,
+                    sender=through,
+                    weak=False,
+                    dispatch_uid=uid,
+                )
+    signals.post_save.connect(
+        __BumpPermissions, sender=Permission, weak=False, dispatch_uid=uid
+    )
+    for sender in (Group, Permission):
+        signals.post_delete.connect(
+            __BumpPermissions, sender=sender, weak=False, dispatch_uid=uid
+        )
+
+
+def __BumpPermissions(**kwargs: Any) -> None:
+    bump_named_version("permissions")
+
+
+def __BumpPermissionsChanged(action: str, **kwargs: Any) -> None:
+    if action.startswith("post_"):
+        bump_named_version("permissions")
@@ -0,0 +1,123 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.template import Engine
+from django.template.base import Template
+
+__all__ = ["TemplateLRU", "reline_templates"]
+
+Key = Tuple[Engine, bytes]
+
+
+class TemplateLRU:
+    """Segmented LRU of compiled templates keyed by engine and source hash.
+
+    New sources enter a probationary segment and are promoted to the
+    protected one on their second hit, so one-off sources are evicted
+    before the hot entries.
+    """
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "evictions",
+        "__maxsize",
+        "__probation",
+        "__protected",
+        "__lock",
+    )
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__maxsize = maxsize
+        self.__probation: OrderedDict[Key, Template] = OrderedDict()
+        self.__protected: OrderedDict[Key, Template] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(hits={self.hits},"
+            f" misses={self.misses}, evictions={self.evictions},"
+            f" size={len(self)}, maxsize={self.maxsize})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.__probation) + len(self.__protected)
+
+    @property
+    def maxsize(self) -> int:
+        if self.__maxsize is None:
+            self.__maxsize = max(
+                int(getattr(settings, "NOMOS_RELINE_CACHE_SIZE", 256)), 1
+            )
+        return self.__maxsize
+
+    def Get(self, engine: Engine, source: str) -> Template:
+        key = (engine, hashlib.sha1(source.encode()).digest())
+        with self.__lock:
+            template = self.__protected.get(key)
+            if template is not None:
+                self.__protected.move_to_end(key)
+                self.hits += 1
+                return template
+            template = self.__probation.pop(key, None)
+            if template is not None:
+                self.__protected[key] = template
+                self.hits += 1
+                self.__Shrink()
+                return template
+            self.misses += 1
+
+        template = engine.from_string(source)
+
+        with self.__lock:
+            if key not in self.__protected:
+                self.__probation[key] = template
+                self.__probation.move_to_end(key)
+                self.__Shrink()
+        return template
+
+    def Clear(self) -> None:
+        with self.__lock:
+            self.__probation.clear()
+            self.__protected.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __Shrink(self) -> None:
+        maxsize = self.maxsize
+        protected_size = maxsize - max(maxsize // 5, 1)
+        while len(self.__protected) > protected_size:
+            key, template = self.__protected.popitem(last=False)
+            self.__probation[key] = template
+        while len(self) > maxsize:
+            self.__probation.popitem(last=False)
+            self.evictions += 1
+
+
+reline_templates = TemplateLRU()
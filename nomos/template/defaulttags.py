@@ -18,34 +18,63 @@
 from __future__ import annotations
 
 import functools
+import hashlib
 import string
-from typing import Dict
+from pathlib import Path
+from typing import Any, Callable, Dict
 
 from django import template
+from django.conf import settings
+
+from .manifest import load_manifest
 
 register = template.Library()
 
 CHS = string.ascii_lowercase
 CHSLEN = len(CHS)
-COUNT = -1
-KEYS: Dict[str, str] = {}
+SKEYLEN = 10
+SKEYS: Dict[str, str] = (
+    load_manifest(settings.NOMOS_SK_MANIFEST)
+    if Path(getattr(settings, "NOMOS_SK_MANIFEST", None) or "").is_file()
+    else {}
+)
+
+
+def sequence_key(i: int) -> str:
+    """Bijective base-26 key: 0 is "a", 25 is "z", 26 is "aa"."""
+    chars = []
+    while i >= 0:
+        i, r = divmod(i, CHSLEN)
+        chars.append(CHS[r])
+        i -= 1
+    return "".join(reversed(chars))
 
 
-@functools.lru_cache(maxsize=1024)
-def __skey(i: int) -> str:
-    return __skey(i // CHSLEN - 1) + CHS[int(i) % CHSLEN] if i + 1 else ""
+def hash_key(s: str) -> str:
+    """SKEYLEN letters derived from the blake2b digest of s."""
+    digest = hashlib.blake2b(s.encode(), digest_size=8).digest()
+    n = int.from_bytes(digest, "big")
+    chars = []
+    for _ in range(SKEYLEN):
+        n, r = divmod(n, CHSLEN)
+        chars.append(CHS[r])
+    return "".join(chars)
 
 
+@functools.lru_cache(maxsize=4096)
 def skey(s: str) -> str:
-    if s in KEYS:
-        return KEYS[s]
-    global COUNT
-    COUNT += 1
-    KEYS[s] = ktok = __skey(COUNT // CHSLEN - 1) + CHS[int(COUNT) % CHSLEN]
-    return ktok
+    """Short key of s from the manifest or derived from its content."""
+    if s in SKEYS:
+        return SKEYS[s]
+    return hash_key(s)
+
+
+@register.filter
+def nomos_url(pattern_url: Callable[[Any], str], pk: Any) -> str:
+    """Menu pattern url of pk: {{ menu.urls.detail|nomos_url:pk }}."""
+    return pattern_url(pk)
 
 
 @register.simple_tag
-@functools.cache
 def nomos_sk(s: str) -> str:
     return skey(s)
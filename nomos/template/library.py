@@ -29,6 +29,8 @@ from django.template.base import NodeList, Parser, Token
 from django.template.context import RequestContext
 from django.template.library import parse_bits
 
+from .cache import reline_templates
+
 if sys.version_info >= (3, 10):
     from typing import ParamSpec
 else:
@@ -118,12 +120,10 @@ class InlineNode(ArgspecNodeBase[str]):
 
 class RelineNode(InlineNode):
     def render(self, context: RequestContext) -> str:
-        return cast(
-            str,
-            context.template.engine.from_string(
-                super().render(context)
-            ).render(context),
+        template = reline_templates.Get(
+            context.template.engine, super().render(context)
         )
+        return cast(str, template.render(context))
 
 
 class BigenNode(ArgspecNodeBase[Tuple[str, str]]):
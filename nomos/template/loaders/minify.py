@@ -0,0 +1,59 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import re
+
+from django.template import Origin
+
+from .wrapper import WrapperLoader
+
+__all__ = ["Loader", "minify"]
+
+KEEP_RE = re.compile(
+    r"(<pre\b.*?</pre>|<textarea\b.*?</textarea>"
+    r"|\{%\s*verbatim\b.*?%\}.*?\{%\s*endverbatim\s*%\})",
+    re.DOTALL | re.IGNORECASE,
+)
+COMMENT_RE = re.compile(
+    r"\{#[^\n]*?#\}|\{%\s*comment\b.*?%\}.*?\{%\s*endcomment\s*%\}",
+    re.DOTALL,
+)
+BETWEEN_TAGS_RE = re.compile(r"(?:(?<=>)|(?<=%\})|\A)\s*\n\s*(?=<|\{%|\Z)")
+NEWLINE_RE = re.compile(r"[ \t]*\n\s*")
+
+
+def minify(source: str) -> str:
+    """Strip template comments and the line breaks between tags.
+
+    Whitespace with a line break between two tags, HTML or template ones,
+    becomes a single space, so inline elements stay apart; elsewhere it
+    becomes a single line break. pre, textarea and verbatim blocks are
+    kept as they are.
+    """
+    parts = KEEP_RE.split(source)
+    for i in range(0, len(parts), 2):
+        part = COMMENT_RE.sub("", parts[i])
+        part = BETWEEN_TAGS_RE.sub(" ", part)
+        parts[i] = NEWLINE_RE.sub("\n", part)
+    return "".join(parts)
+
+
+class Loader(WrapperLoader):
+    """Minifies the sources of the wrapped loaders when loaded."""
+
+    def Transform(self, contents: str, origin: Origin) -> str:
+        return minify(contents)
@@ -0,0 +1,242 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import functools
+import hashlib
+import hmac
+import io
+import os
+import pickle
+import tempfile
+from importlib import import_module, metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import django
+from django.conf import settings
+from django.template import (
+    Engine,
+    Origin,
+    Template,
+    TemplateDoesNotExist,
+    smartif,
+)
+from django.template.loaders import base, cached
+from django.utils.encoding import force_bytes
+
+__all__ = ["Loader"]
+
+_smartif_operators: Dict[type, str] = {
+    op: key for key, op in smartif.OPERATORS.items()
+}
+
+
+def _smartif_operator(key: str) -> type:
+    return smartif.OPERATORS[key]
+
+
+def _smartif_token(key: str) -> smartif.TokenBase:
+    return smartif.OPERATORS[key]()
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(
+        self, file: io.BytesIO, engine: Engine, origin: Origin
+    ) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.engine = engine
+        self.origin = origin
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if obj is self.engine:
+            return "engine"
+        if obj is self.origin:
+            return "origin"
+        if isinstance(obj, base.Loader):
+            return "loader"
+        return None
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, type):
+            key = _smartif_operators.get(obj)
+            if key is not None:
+                return _smartif_operator, (key,)
+        else:
+            key = _smartif_operators.get(type(obj))
+            if key is not None:
+                return _smartif_token, (key,), obj.__dict__
+        return NotImplemented
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(
+        self, file: io.BytesIO, engine: Engine, origin: Origin
+    ) -> None:
+        super().__init__(file)
+        self.engine = engine
+        self.origin = origin
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == "engine":
+            return self.engine
+        if pid == "origin":
+            return self.origin
+        if pid == "loader":
+            return self.origin.loader
+        raise pickle.UnpicklingError(f"Unknown persistent id: {pid!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def _libraries_digest(modules: Tuple[str, ...]) -> str:
+    """Hash of the nomos version and of the source of the tag modules."""
+    try:
+        version = metadata.version("nomos")
+    except metadata.PackageNotFoundError:
+        version = ""
+
+    digest = hashlib.sha256(version.encode())
+    for name in modules:
+        digest.update(b"\0" + name.encode() + b"\0")
+        path = getattr(import_module(name), "__file__", None)
+        if path is not None:
+            digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+class PersistentMixin(base.Loader):
+    """Compiles templates through a signed pickle cache on disk.
+
+    Entries are keyed by the template source hash, so processes sharing
+    the directory agree on them without comparing mtimes. The key also
+    covers the Django and nomos versions and the source of the loaded tag
+    libraries, so upgrades never unpickle stale nodes. Templates that do
+    not pickle are compiled as usual and not stored.
+    """
+
+    cache_dir: Path
+
+    def get_template(
+        self, template_name: str, skip: Optional[List[Origin]] = None
+    ) -> Template:
+        tried: List[Tuple[Origin, str]] = []
+
+        for origin in self.get_template_sources(template_name):
+            if skip is not None and origin in skip:
+                tried.append((origin, "Skipped to avoid recursion"))
+                continue
+
+            try:
+                contents = self.get_contents(origin)
+            except TemplateDoesNotExist:
+                tried.append((origin, "Source does not exist"))
+                continue
+            else:
+                return self.Compile(contents, origin)
+
+        raise TemplateDoesNotExist(template_name, tried=tried)
+
+    def Compile(self, contents: str, origin: Origin) -> Template:
+        path = self.cache_dir / f"{self.__Key(contents, origin)}.pickle"
+
+        template = self.__Read(path, origin)
+        if template is None:
+            template = Template(
+                contents, origin, origin.template_name, self.engine
+            )
+            self.__Write(path, template, origin)
+        return template
+
+    def __Key(self, contents: str, origin: Origin) -> str:
+        key = hashlib.sha256()
+        modules = {*self.engine.libraries.values(), *self.engine.builtins}
+        for part in (
+            django.__version__,
+            _libraries_digest(tuple(sorted(modules))),
+            str(self.engine.debug),
+            repr(sorted(self.engine.libraries.items())),
+            repr(self.engine.builtins),
+            origin.name,
+            str(origin.template_name),
+            contents,
+        ):
+            key.update(part.encode())
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def __Read(self, path: Path, origin: Origin) -> Optional[Template]:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        digest, payload = data[:32], data[32:]
+        if not hmac.compare_digest(digest, self.__Sign(payload)):
+            return None
+
+        try:
+            template = _Unpickler(
+                io.BytesIO(payload), self.engine, origin
+            ).load()
+        except Exception:
+            return None
+        return template if isinstance(template, Template) else None
+
+    def __Write(self, path: Path, template: Template, origin: Origin) -> None:
+        buffer = io.BytesIO()
+        try:
+            _Pickler(buffer, self.engine, origin).dump(template)
+        except Exception:
+            return
+
+        payload = buffer.getvalue()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fp:
+                    fp.write(self.__Sign(payload))
+                    fp.write(payload)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+    @staticmethod
+    def __Sign(payload: bytes) -> bytes:
+        return hmac.new(
+            force_bytes(settings.SECRET_KEY), payload, hashlib.sha256
+        ).digest()
+
+
+class Loader(cached.Loader, PersistentMixin):
+    """Django's cached loader backed by a persistent compile cache.
+
+    cache_dir defaults to settings.NOMOS_TEMPLATE_CACHE_DIR.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        loaders: List[Any],
+        cache_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
+        super().__init__(engine, loaders)
+        if cache_dir is None:
+            cache_dir = settings.NOMOS_TEMPLATE_CACHE_DIR
+        self.cache_dir = Path(cache_dir)
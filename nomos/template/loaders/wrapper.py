@@ -0,0 +1,59 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any, Iterator, List
+
+from django.template import Engine, Origin
+from django.template.loaders import base
+
+__all__ = ["WrappedOrigin", "WrapperLoader"]
+
+
+class WrappedOrigin(Origin):
+    """Origin of a wrapped loader, routing get_contents to the wrapper."""
+
+    def __init__(self, origin: Origin, loader: base.Loader) -> None:
+        super().__init__(origin.name, origin.template_name, loader)
+        self.wrapped = origin
+
+
+class WrapperLoader(base.Loader):
+    """Loads through other loaders and transforms the template sources."""
+
+    def __init__(self, engine: Engine, loaders: List[Any]) -> None:
+        super().__init__(engine)
+        self.loaders = engine.get_template_loaders(loaders)
+
+    def get_template_sources(self, template_name: str) -> Iterator[Origin]:
+        for loader in self.loaders:
+            for origin in loader.get_template_sources(template_name):
+                yield WrappedOrigin(origin, self)
+
+    def get_contents(self, origin: Origin) -> str:
+        wrapped = (
+            origin.wrapped if isinstance(origin, WrappedOrigin) else origin
+        )
+        contents = wrapped.loader.get_contents(wrapped)
+        return self.Transform(contents, origin)
+
+    def Transform(self, contents: str, origin: Origin) -> str:
+        return contents
+
+    def reset(self) -> None:
+        for loader in self.loaders:
+            if hasattr(loader, "reset"):
+                loader.reset()
@@ -0,0 +1,92 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from django.template import engines
+
+__all__ = [
+    "template_dirs",
+    "find_skeys",
+    "make_manifest",
+    "hash_collisions",
+    "load_manifest",
+    "dump_manifest",
+]
+
+SK_RE = re.compile(r"""{%\s*nomos_sk\s+(["'])(.*?)\1\s*%}""")
+
+
+def template_dirs() -> List[Path]:
+    dirs: Dict[Path, None] = {}
+    for engine in engines.all():
+        for directory in getattr(engine, "template_dirs", ()):
+            dirs[Path(directory)] = None
+    return list(dirs)
+
+
+def find_skeys(dirs: Iterable[Path]) -> Counter[str]:
+    """Count the literal nomos_sk names used in the templates of dirs."""
+    names: Counter[str] = Counter()
+    for directory in dirs:
+        for path in sorted(Path(directory).rglob("*")):
+            if not path.is_file():
+                continue
+            try:
+                source = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            names.update(match[2] for match in SK_RE.finditer(source))
+    return names
+
+
+def make_manifest(names: Counter[str]) -> Dict[str, str]:
+    """Allocate sequence keys, the shortest ones to the most used names."""
+    from .defaulttags import sequence_key
+
+    ordered = sorted(names, key=lambda name: (-names[name], name))
+    return {name: sequence_key(i) for i, name in enumerate(ordered)}
+
+
+def hash_collisions(names: Iterable[str]) -> List[List[str]]:
+    """Groups of names sharing a hashed short key, used without manifest."""
+    from .defaulttags import hash_key
+
+    groups: Dict[str, List[str]] = {}
+    for name in sorted(set(names)):
+        groups.setdefault(hash_key(name), []).append(name)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def load_manifest(path: Path) -> Dict[str, str]:
+    with open(path, encoding="utf-8") as fp:
+        manifest = json.load(fp)
+    if not isinstance(manifest, dict):
+        raise ValueError(f"Invalid short-key manifest: {path}")
+    return {str(name): str(key) for name, key in manifest.items()}
+
+
+def dump_manifest(manifest: Dict[str, str], path: Path) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, separators=(",", ":"), sort_keys=True)
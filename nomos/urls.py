@@ -15,9 +15,12 @@
 # You should have received a copy of the GNU General Public License along
 # with Nomos. If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Optional, Tuple, Type
+import functools
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, cast
 
+from asgiref.sync import markcoroutinefunction
 from django.db import models
+from django.http import HttpRequest
 from django.urls import URLPattern, path
 
 from .views.generic import menu as views_menu
@@ -35,39 +38,91 @@ def menu_patterns(
     patterns_prefix: str,
     pk_url_type: Optional[str] = None,
     menu_traits: views_menu.MenuTraits = default_menu_traits,
+    asynchronous: bool = False,
+    lazy: bool = True,
 ) -> Tuple[List[URLPattern], str]:
-    views = views_menu.menuviews_factory(
+    """Route the menu views of a model.
+
+    With lazy, the view classes are built on the first request that
+    reaches any of them, instead of at urlconf import. Until then the
+    route callbacks carry the decorator attributes of the dispatch of
+    the traits bases (csrf_exempt), but not view_class and
+    view_initkwargs.
+    """
+    build = functools.partial(
+        views_menu.menuviews,
         model,
         template_basedir,
         f"{patterns_prefix}:{app_name}",
         menu_traits,
+        asynchronous,
+    )
+    views_menu.register_menuviews(
+        (model, f"{patterns_prefix}:{app_name}"), build
     )
-    pk_url_kwarg = views.detail.pk_url_kwarg
+    views_menu.track_menu_models(model, menu_traits)
+    pk_url_kwarg = views_menu.pk_url_name(model)
     if pk_url_type is None:
         pk_url_type = __infer_pk_url_type(model)
 
-    return (
-        [
-            path("list/", views.list.as_view(), name="list"),
-            path("create/", views.create.as_view(), name="create"),
-            path(
-                f"<{pk_url_type}:{pk_url_kwarg}>/detail/",
-                views.detail.as_view(),
-                name="detail",
-            ),
-            path(
-                f"<{pk_url_type}:{pk_url_kwarg}>/update/",
-                views.update.as_view(),
-                name="update",
-            ),
-            path(
-                f"<{pk_url_type}:{pk_url_kwarg}>/delete/",
-                views.delete.as_view(),
-                name="delete",
-            ),
-        ],
-        app_name,
-    )
+    def view(name: str, asynchronous: bool = False) -> Callable[..., Any]:
+        if not lazy:
+            return cast(Callable[..., Any], getattr(build(), name).as_view())
+        return __lazy_view(
+            build,
+            name,
+            asynchronous,
+            views_menu.dispatch_attrs(menu_traits, name),
+        )
+
+    patterns = [
+        path("list/", view("list", asynchronous), name="list"),
+        path("create/", view("create", asynchronous), name="create"),
+        path(
+            f"<{pk_url_type}:{pk_url_kwarg}>/detail/",
+            view("detail", asynchronous),
+            name="detail",
+        ),
+        path(
+            f"<{pk_url_type}:{pk_url_kwarg}>/update/",
+            view("update", asynchronous),
+            name="update",
+        ),
+        path(
+            f"<{pk_url_type}:{pk_url_kwarg}>/delete/",
+            view("delete", asynchronous),
+            name="delete",
+        ),
+    ]
+    if menu_traits.export is not None:
+        patterns.append(path("export/", view("export"), name="export"))
+    if menu_traits.import_ is not None:
+        patterns.append(path("import/", view("import_"), name="import"))
+    if menu_traits.bulk is not None:
+        patterns.append(path("bulk/", view("bulk"), name="bulk"))
+
+    return patterns, app_name
+
+
+def __lazy_view(
+    build: Callable[[], views_menu.MenuViews],
+    name: str,
+    asynchronous: bool,
+    attrs: Dict[str, Any],
+) -> Callable[..., Any]:
+    as_view: Optional[Callable[..., Any]] = None
+
+    def view(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        nonlocal as_view
+        if as_view is None:
+            as_view = getattr(build(), name).as_view()
+            view.__dict__.update(as_view.__dict__)
+        return as_view(request, *args, **kwargs)
+
+    view.__dict__.update(attrs)
+    if asynchronous:
+        markcoroutinefunction(view)
+    return view
 
 
 def __infer_pk_url_type(model: Type[models.Model]) -> str:
@@ -0,0 +1,350 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import inspect
+from typing import Any, Optional, Tuple, cast
+
+from asgiref.sync import sync_to_async
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.db.models import Model, QuerySet
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+)
+from django.utils.translation import gettext as _
+from django.views.generic.base import View
+from django.views.generic.detail import DetailView, SingleObjectMixin
+from django.views.generic.edit import CreateView, DeleteView, UpdateView
+from django.views.generic.list import ListView
+
+from ...shortcuts import permission_snapshot
+from .base import PermissionSnapshotMixin
+from .list import StreamingListMixin
+
+__all__ = [
+    "AsyncDispatchMixin",
+    "AsyncListView",
+    "AsyncDetailView",
+    "AsyncCreateView",
+    "AsyncUpdateView",
+    "AsyncDeleteView",
+]
+
+_PageData = Tuple[Paginator, Page, QuerySet[Model], bool]
+
+
+class AsyncDispatchMixin(View):
+    """Runs the sync dispatch of the bases before it in a thread.
+
+    Permission bases such as LoginRequiredMixin read request.user and the
+    database from their sync dispatch. The user is loaded with auser()
+    and, for PermissionSnapshotMixin views, the permission snapshot in
+    that thread, so the async handler finds both in memory.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs: Any) -> Any:
+        view = super().as_view(**initkwargs)
+        # the decorators of the wrapped sync dispatch, such as csrf_exempt
+        start = cls.__mro__.index(AsyncDispatchMixin) + 1
+        for klass in cls.__mro__[start:]:
+            dispatch = vars(klass).get("dispatch")
+            if dispatch is not None:
+                view.__dict__.update(getattr(dispatch, "__dict__", {}))
+                break
+        return view
+
+    async def dispatch(  # type: ignore[override]
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        auser = getattr(request, "auser", None)
+        if auser is not None:
+            request.user = await auser()
+
+        response = await sync_to_async(self.__Dispatch)(
+            request, *args, **kwargs
+        )
+        if inspect.isawaitable(response):
+            response = await response
+        return cast(HttpResponse, response)
+
+    def __Dispatch(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> Any:
+        if isinstance(self, PermissionSnapshotMixin) and hasattr(
+            request, "user"
+        ):
+            permission_snapshot(request)
+        return super().dispatch(request, *args, **kwargs)
+
+
+class AsyncListView(ListView[Model]):
+    """Fetches the page rows with the async ORM before the sync context.
+
+    The async iteration fills the queryset result cache, so the inherited
+    context and template code read the rows without touching the database.
+    Views with their own ``paginate_queryset`` are built in a thread.
+    StreamingListMixin views fetch nothing here, their stream reads the
+    rows once.
+    """
+
+    __page: Optional[_PageData] = None
+
+    async def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        self.object_list = self.get_queryset()
+
+        if not self.__IsNative():
+            context = await sync_to_async(self.get_context_data)()
+            return self.render_to_response(context)
+
+        streaming = isinstance(self, StreamingListMixin)
+        page_size = self.get_paginate_by(self.object_list)
+        if page_size:
+            self.__page = await self.__Paginate(self.object_list, page_size)
+        elif not streaming:
+            await self.__Fetch(self.object_list)
+
+        if not self.get_allow_empty() and (
+            not self.__page[0].count
+            if self.__page
+            else (
+                not await self.object_list.aexists()
+                if streaming
+                else not self.object_list
+            )
+        ):
+            raise Http404(
+                _("Empty list and “%(class_name)s.allow_empty” is False.")
+                % {"class_name": self.__class__.__name__}
+            )
+
+        context = self.get_context_data()
+        return self.render_to_response(context)
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Model], page_size: int
+    ) -> _PageData:
+        if self.__page is not None:
+            return self.__page
+        return super().paginate_queryset(queryset, page_size)
+
+    def __IsNative(self) -> bool:
+        return (
+            isinstance(self.object_list, QuerySet)
+            and self.paginator_class is Paginator
+            and type(self).paginate_queryset is AsyncListView.paginate_queryset
+        )
+
+    async def __Paginate(
+        self, queryset: QuerySet[Model], page_size: int
+    ) -> _PageData:
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        paginator.count = await queryset.acount()
+
+        page_kwarg = self.page_kwarg
+        page = (
+            self.kwargs.get(page_kwarg)
+            or self.request.GET.get(page_kwarg)
+            or 1
+        )
+        try:
+            page_number = int(page)
+        except ValueError:
+            if page == "last":
+                page_number = paginator.num_pages
+            else:
+                raise Http404(
+                    _("Page is not “last”, nor can it be converted to an int.")
+                )
+
+        try:
+            number = paginator.validate_number(page_number)
+        except InvalidPage as e:
+            raise Http404(
+                _("Invalid page (%(page_number)s): %(message)s")
+                % {"page_number": page_number, "message": str(e)}
+            )
+
+        bottom = (number - 1) * paginator.per_page
+        top = bottom + paginator.per_page
+        if top + paginator.orphans >= paginator.count:
+            top = paginator.count
+
+        object_list = queryset[bottom:top]
+        if not isinstance(self, StreamingListMixin):
+            await self.__Fetch(object_list)
+        page_obj = paginator._get_page(object_list, number, paginator)
+        return paginator, page_obj, object_list, page_obj.has_other_pages()
+
+    @staticmethod
+    async def __Fetch(queryset: QuerySet[Model]) -> QuerySet[Model]:
+        # the first step of the async iterator fills the result cache
+        async for _obj in queryset:
+            break
+        return queryset
+
+
+class AsyncSingleObjectMixin(SingleObjectMixin[Model]):
+    async def aget_object(
+        self, queryset: Optional[QuerySet[Model]] = None
+    ) -> Model:
+        if queryset is None:
+            queryset = self.get_queryset()
+
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        slug = self.kwargs.get(self.slug_url_kwarg)
+        if pk is not None:
+            queryset = queryset.filter(pk=pk)
+
+        if slug is not None and (pk is None or self.query_pk_and_slug):
+            slug_field = self.get_slug_field()
+            queryset = queryset.filter(**{slug_field: slug})
+
+        if pk is None and slug is None:
+            raise AttributeError(
+                "Generic detail view %s must be called with either an object "
+                "pk or a slug in the URLconf."
+                % self.__class__.__name__
+            )
+
+        try:
+            return await queryset.aget()
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                _("No %(verbose_name)s found matching the query")
+                % {"verbose_name": queryset.model._meta.verbose_name}
+            )
+
+
+class AsyncDetailView(AsyncSingleObjectMixin, DetailView[Model]):
+    async def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        self.object = await self.aget_object()
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
+
+
+class AsyncModelFormMixin:
+    """Validates in a thread and saves the instance with the async ORM.
+
+    form_valid is async; overrides should be async too and await super().
+    A sync override still runs, in a thread. Rendering stays lazy: the
+    handler renders template responses in a thread, so choice fields may
+    still query while the form is drawn.
+    """
+
+    async def post(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        view: Any = self
+        form = view.get_form()
+        if not await sync_to_async(form.is_valid)():
+            return view.form_invalid(form)
+        return await _FormValid(view, form)
+
+    async def form_valid(self, form: Any) -> HttpResponse:
+        view: Any = self
+        view.object = form.save(commit=False)
+        await view.object.asave()
+        await sync_to_async(form.save_m2m)()
+        return HttpResponseRedirect(view.get_success_url())
+
+    async def put(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        return await self.post(request, *args, **kwargs)
+
+
+class AsyncCreateView(AsyncModelFormMixin, CreateView[Model, Any]):
+    async def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        self.object = None
+        return self.render_to_response(self.get_context_data())
+
+    async def post(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        self.object = None
+        return await super().post(request, *args, **kwargs)
+
+
+class AsyncUpdateView(
+    AsyncSingleObjectMixin, AsyncModelFormMixin, UpdateView[Model, Any]
+):
+    async def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        self.object = await self.aget_object()
+        return self.render_to_response(self.get_context_data())
+
+    async def post(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        self.object = await self.aget_object()
+        return await super().post(request, *args, **kwargs)
+
+
+class AsyncDeleteView(AsyncSingleObjectMixin, DeleteView[Model, Any]):
+    async def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        self.object = await self.aget_object()
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
+
+    async def post(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        self.object = await self.aget_object()
+        form = self.get_form()
+        if not await sync_to_async(form.is_valid)():
+            return self.form_invalid(form)
+        return await _FormValid(self, form)
+
+    async def form_valid(  # type: ignore[override]
+        self, form: Any
+    ) -> HttpResponse:
+        success_url = self.get_success_url()
+        await self.object.adelete()
+        return HttpResponseRedirect(success_url)
+
+    async def delete(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        return await self.post(request, *args, **kwargs)
+
+
+async def _FormValid(view: Any, form: Any) -> HttpResponse:
+    """Await form_valid, running a sync override in a thread."""
+    if asyncio.iscoroutinefunction(view.form_valid):
+        return cast(HttpResponse, await view.form_valid(form))
+    response = await sync_to_async(view.form_valid)(form)
+    if inspect.isawaitable(response):
+        response = await response
+    return cast(HttpResponse, response)
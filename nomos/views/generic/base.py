@@ -15,14 +15,92 @@
 # You should have received a copy of the GNU General Public License along
 # with Nomos. If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, Callable, List, Optional, Type, cast
+import functools
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
 
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.forms import models as model_forms
 from django.views.generic import base as base_views
+from django.views.generic import edit as edit_views
 
-__all__ = ["MixModelFormMixin"]
+from ...shortcuts import PermissionNames, permission_snapshot
+
+__all__ = [
+    "MixModelFormMixin",
+    "PermissionSnapshotMixin",
+    "RelatedQuerySetMixin",
+    "SharedFormClassMixin",
+    "modelform_class",
+]
+
+_form_classes: Dict[Hashable, Type[model_forms.ModelForm]] = {}
+_form_classes_lock = threading.Lock()
+
+
+def modelform_class(
+    view_class: type,
+    model: Type[models.Model],
+    fields: Any,
+    form_mixins: List[Any],
+    formfield_callback: Optional[Callable[[models.Field], model_forms.Field]],
+    cache: bool = True,
+) -> Type[model_forms.ModelForm]:
+    """Build the ModelForm class of a view, shared by its requests.
+
+    A method-style formfield_callback is keyed by its function, since the
+    bound method differs per view instance. A shared class binds it to a
+    new view instead, so the class keeps no request alive; it only runs
+    while the class is built.
+    """
+    func = getattr(formfield_callback, "__func__", formfield_callback)
+    key = (
+        view_class,
+        model,
+        fields if isinstance(fields, str) else tuple(fields),
+        tuple(form_mixins),
+        func,
+    )
+    try:
+        form_class = _form_classes.get(key) if cache else None
+    except TypeError:
+        cache = False
+        form_class = None
+
+    if form_class is not None:
+        return form_class
+
+    if cache and func is not formfield_callback:
+        view = type(getattr(formfield_callback, "__self__"))()
+        formfield_callback = functools.partial(func, view)
+
+    model_form = type("ModelForm", (model_forms.ModelForm, *form_mixins), {})
+    form_class = cast(
+        Type[model_forms.ModelForm],
+        model_forms.modelform_factory(
+            model,
+            model_form,
+            fields=fields,
+            formfield_callback=formfield_callback,
+        ),
+    )
+
+    if cache:
+        with _form_classes_lock:
+            form_class = _form_classes.setdefault(key, form_class)
+    return form_class
 
 
 class MixModelFormMixin(base_views.View):
@@ -30,6 +108,7 @@ class MixModelFormMixin(base_views.View):
     formfield_callback: Optional[
         Callable[[models.Field], model_forms.Field]
     ] = None
+    cache_form_class = True
 
     form_class: Optional[Type[model_forms.ModelForm]]
 
@@ -53,16 +132,94 @@ class MixModelFormMixin(base_views.View):
                 else self.get_queryset().model
             )
 
-            model_form = type(
-                "ModelForm", (model_forms.ModelForm, *self.form_mixins), {}
+            return modelform_class(
+                self.__class__,
+                model,
+                self.fields,
+                self.form_mixins,
+                self.formfield_callback,
+                self.cache_form_class,
             )
 
-            return cast(
-                Type[model_forms.ModelForm],
-                model_forms.modelform_factory(
-                    model,
-                    model_form,
-                    fields=self.fields,
-                    formfield_callback=self.formfield_callback,
-                ),
+
+class SharedFormClassMixin(edit_views.ModelFormMixin[Any, Any]):
+    """Shares the ModelForm class built from model and fields.
+
+    Other cases, as form_class, keep the ModelFormMixin behavior.
+    """
+
+    def get_form_class(self) -> Type[model_forms.ModelForm]:
+        if (
+            self.form_class is None
+            and self.fields is not None
+            and self.model is not None
+        ):
+            return modelform_class(
+                self.__class__, self.model, self.fields, [], None
             )
+        return cast(Type[model_forms.ModelForm], super().get_form_class())
+
+
+class RelatedQuerySetMixin:
+    """Joins the forward relations displayed by the view.
+
+    With select_related None, the plan joins every forward ForeignKey and
+    OneToOneField of the model listed in fields ("__all__" or unset means
+    all of them).
+    """
+
+    select_related: Optional[Sequence[str]] = None
+    prefetch_related: Sequence[str] = ()
+
+    def get_queryset(self) -> models.QuerySet[models.Model]:
+        queryset = cast(
+            models.QuerySet[models.Model], cast(Any, super()).get_queryset()
+        )
+
+        select_related = (
+            self.PlanSelectRelated(queryset.model)
+            if self.select_related is None
+            else tuple(self.select_related)
+        )
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+
+        return queryset
+
+    def PlanSelectRelated(self, model: Type[models.Model]) -> Tuple[str, ...]:
+        fields = getattr(self, "fields", None)
+        names = None if fields is None or fields == "__all__" else set(fields)
+        return tuple(
+            field.name
+            for field in model._meta.fields
+            if (field.many_to_one or field.one_to_one)
+            and (names is None or field.name in names)
+        )
+
+
+class PermissionSnapshotMixin(base_views.ContextMixin):
+    """Adds the can_list, can_create, can_detail, can_update and can_delete
+    flags of the view model, checked against one permission snapshot of
+    the user per request.
+    """
+
+    request: Any
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+
+        model = getattr(self, "model", None)
+        if model is None:
+            model = cast(Any, self).get_queryset().model
+
+        names = PermissionNames.Make(model)
+        snapshot = permission_snapshot(self.request)
+        context["can_list"] = snapshot.has_perms(names.list)
+        context["can_create"] = snapshot.has_perms(names.create)
+        context["can_detail"] = snapshot.has_perms(names.detail)
+        context["can_update"] = snapshot.has_perms(names.update)
+        context["can_delete"] = snapshot.has_perms(names.delete)
+
+        return context
@@ -0,0 +1,499 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import codecs
+import csv
+import datetime
+import functools
+import io
+import json
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    PermissionDenied,
+    ValidationError,
+)
+from django.core.files.uploadedfile import UploadedFile
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, router, transaction
+from django.db.models import Model, ProtectedError, QuerySet, RestrictedError
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from django.utils import timezone
+from django.views.generic.base import ContextMixin, TemplateResponseMixin, View
+from django.views.generic.list import MultipleObjectMixin
+
+from ...core.cache import bump_model_version
+from ...shortcuts import PermissionNames, permission_snapshot
+from .base import MixModelFormMixin, modelform_class
+
+__all__ = ["ExportView", "ImportView", "ImportReport", "BulkActionView"]
+
+_CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _ExportJSONEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder keeping the microseconds of datetimes and times."""
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, datetime.datetime):
+            value = o.isoformat()
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+        if isinstance(o, datetime.time):
+            return o.isoformat()
+        return super().default(o)
+
+
+class ExportView(MultipleObjectMixin[Model], View):
+    """Streams the list queryset as CSV or JSON Lines.
+
+    Rows are read with values_list through a server-side cursor in chunks
+    of export_chunk_size, so memory stays constant whatever the size of
+    the table. CSV text cells that a spreadsheet would run as a formula
+    are prefixed with a quote.
+    """
+
+    fields: Union[str, Sequence[str]] = "__all__"
+    export_chunk_size = 2000
+    format_kwarg = "format"
+    default_format = "csv"
+
+    def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> StreamingHttpResponse:
+        export_format = request.GET.get(self.format_kwarg, self.default_format)
+        if export_format == "csv":
+            content_type, stream = "text/csv", self.__StreamCsv
+        elif export_format == "jsonl":
+            content_type, stream = "application/jsonl", self.__StreamJsonl
+        else:
+            raise Http404(f"Unsupported export format: {export_format}")
+
+        queryset = self.get_queryset()
+        names = self.GetExportFields(queryset)
+        rows = queryset.values_list(*names).iterator(
+            chunk_size=self.export_chunk_size
+        )
+
+        response = StreamingHttpResponse(
+            stream(names, rows), content_type=content_type
+        )
+        filename = f"{queryset.model._meta.model_name}.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def GetExportFields(self, queryset: QuerySet[Model]) -> Tuple[str, ...]:
+        if self.fields == "__all__":
+            return tuple(
+                field.attname for field in queryset.model._meta.concrete_fields
+            )
+        return tuple(self.fields)
+
+    def __StreamCsv(
+        self, names: Sequence[str], rows: Iterator[Tuple[Any, ...]]
+    ) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(names)
+        for chunk in self.__Chunks(rows):
+            writer.writerows(map(self.__CsvRow, chunk))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+
+    def __StreamJsonl(
+        self, names: Sequence[str], rows: Iterator[Tuple[Any, ...]]
+    ) -> Iterator[str]:
+        encoder = _ExportJSONEncoder(separators=(",", ":"))
+        for chunk in self.__Chunks(rows):
+            yield "".join(
+                f"{encoder.encode(dict(zip(names, row)))}\n" for row in chunk
+            )
+
+    @staticmethod
+    def __CsvRow(row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        return tuple(
+            (
+                f"'{value}"
+                if isinstance(value, str)
+                and value.startswith(_CSV_FORMULA_PREFIXES)
+                else value
+            )
+            for value in row
+        )
+
+    def __Chunks(
+        self, rows: Iterator[Tuple[Any, ...]]
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        chunk: List[Tuple[Any, ...]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.export_chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+_INTEGRITY_ERROR = {
+    "__all__": [
+        {"message": "Violates a database constraint", "code": "integrity"}
+    ]
+}
+
+
+class ImportReport(NamedTuple):
+    created: int
+    failed: int
+    errors: List[Tuple[int, Dict[str, Any]]]
+
+
+class ImportView(TemplateResponseMixin, ContextMixin, MixModelFormMixin):
+    """Creates objects from an uploaded CSV or JSON Lines file.
+
+    The upload is parsed row by row and each row is validated with the
+    generated ModelForm. Valid rows are written with bulk_create in
+    batches of import_batch_size inside one transaction, and the template
+    receives an ImportReport with the errors by line. A batch that breaks
+    a database constraint is retried row by row, so only the offending
+    rows are reported. With import_atomic, the first invalid row stops
+    the import and rolls it back.
+    Many-to-many fields are not imported.
+    """
+
+    model: Optional[type] = None
+    fields: Union[str, Sequence[str], None] = "__all__"
+    form_class = None
+
+    file_field = "file"
+    import_batch_size = 1000
+    import_atomic = False
+    max_import_errors = 1000
+
+    def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        return self.render_to_response(self.get_context_data())
+
+    def post(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        upload = request.FILES.get(self.file_field)
+        if upload is None:
+            return self.render_to_response(
+                self.get_context_data(import_error="No file uploaded"),
+                status=400,
+            )
+
+        report = self.ImportRows(self.__Rows(upload))
+        return self.render_to_response(
+            self.get_context_data(import_report=report)
+        )
+
+    def ImportRows(
+        self, rows: Iterator[Tuple[int, Union[Dict[str, Any], str]]]
+    ) -> ImportReport:
+        """Validate and create the rows; a str row is a parse error."""
+        form_class = self.get_form_class()
+        model = form_class._meta.model
+        using = router.db_for_write(model)
+        created = failed = 0
+        errors: List[Tuple[int, Dict[str, Any]]] = []
+        batch: List[Tuple[int, Model]] = []
+
+        def fail(line: int, error: Dict[str, Any]) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < self.max_import_errors:
+                errors.append((line, error))
+
+        def flush() -> None:
+            nonlocal created
+            count, failures = self.__CreateBatch(model, using, batch)
+            created += count
+            for line, error in failures:
+                fail(line, error)
+            batch.clear()
+
+        with transaction.atomic(using=using):
+            for line, row in rows:
+                form = form_class(data=row) if isinstance(row, dict) else None
+                if form is not None and form.is_valid():
+                    batch.append((line, form.save(commit=False)))
+                    if len(batch) >= self.import_batch_size:
+                        flush()
+                else:
+                    fail(
+                        line,
+                        (
+                            form.errors.get_json_data()
+                            if form is not None
+                            else {"__all__": [{"message": row}]}
+                        ),
+                    )
+                if failed and self.import_atomic:
+                    break
+
+            if batch and not (failed and self.import_atomic):
+                flush()
+
+            if failed and self.import_atomic:
+                transaction.set_rollback(True, using=using)
+                created = 0
+
+        if created:
+            # bulk_create sends no signals for track_model
+            transaction.on_commit(
+                functools.partial(bump_model_version, model), using=using
+            )
+        return ImportReport(created, failed, errors)
+
+    @staticmethod
+    def __CreateBatch(
+        model: Type[Model], using: str, batch: List[Tuple[int, Model]]
+    ) -> Tuple[int, List[Tuple[int, Dict[str, Any]]]]:
+        """bulk_create the batch, or row by row when a constraint fails."""
+        objs = [obj for _, obj in batch]
+        try:
+            with transaction.atomic(using=using):
+                return len(model._default_manager.bulk_create(objs)), []
+        except IntegrityError:
+            pass
+
+        auto_field = model._meta.auto_field
+        created = 0
+        failures: List[Tuple[int, Dict[str, Any]]] = []
+        for line, obj in batch:
+            if auto_field is not None:
+                setattr(obj, auto_field.attname, None)
+            try:
+                with transaction.atomic(using=using):
+                    model._default_manager.bulk_create([obj])
+            except IntegrityError:
+                failures.append((line, _INTEGRITY_ERROR))
+            else:
+                created += 1
+        return created, failures
+
+    def __Rows(
+        self, upload: UploadedFile
+    ) -> Iterator[Tuple[int, Union[Dict[str, Any], str]]]:
+        lines = codecs.iterdecode(upload, "utf-8-sig")
+        name = (upload.name or "").lower()
+        line = 0
+
+        try:
+            if name.endswith((".jsonl", ".ndjson")):
+                for line, text in enumerate(lines, 1):
+                    if not text.strip():
+                        continue
+                    try:
+                        row = json.loads(text)
+                    except ValueError:
+                        row = None
+                    yield line, (
+                        row if isinstance(row, dict) else "Malformed row"
+                    )
+            else:
+                reader = csv.DictReader(lines)
+                for row in reader:
+                    line = reader.line_num
+                    yield line, row
+        except UnicodeDecodeError:
+            yield line + 1, "The file is not UTF-8 text"
+        except csv.Error as error:
+            yield line + 1, f"Malformed CSV: {error}"
+
+
+class BulkActionView(MultipleObjectMixin[Model], View):
+    """Updates one field or deletes the objects of the posted pks.
+
+    The update runs as a single QuerySet.update() with the value posted
+    under the field name, cleaned by a ModelForm of that field. Deletion
+    runs in chunks of delete_chunk_size pks, one transaction each, so
+    cascades over a large selection never hold locks for the whole batch.
+    The update also sets the auto_now fields, as save() would, so the
+    ConditionalMixin ETag and Last-Modified see it.
+    Protected objects are kept and listed in a 409 response, and a value
+    breaking a unique constraint is answered as a bad request. Pks may
+    be repeated or comma separated. The user needs the PermissionNames
+    of the action, checked once per request.
+    """
+
+    pks_kwarg = "pks"
+    action_kwarg = "action"
+    field_kwarg = "field"
+    delete_chunk_size = 500
+    max_bulk_pks = 10000
+    success_url: Optional[str] = None
+
+    def post(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        queryset = self.get_queryset()
+        model = queryset.model
+        action = request.POST.get(self.action_kwarg)
+        permissions = PermissionNames.Make(model)
+
+        if action == "delete":
+            required = permissions.delete
+        elif action == "update":
+            required = permissions.update
+        else:
+            return HttpResponseBadRequest(
+                "Unsupported bulk action", content_type="text/plain"
+            )
+
+        if not permission_snapshot(request).has_perms(required):
+            raise PermissionDenied
+
+        try:
+            pks = self.__Pks(model)
+        except ValidationError as error:
+            return HttpResponseBadRequest(
+                "; ".join(error.messages), content_type="text/plain"
+            )
+
+        if action == "delete":
+            _, kept = self.BulkDelete(queryset, pks)
+            if kept:
+                return HttpResponse(
+                    "Kept protected objects: "
+                    + ", ".join(str(pk) for pk in kept),
+                    status=409,
+                    content_type="text/plain",
+                )
+        else:
+            field = request.POST.get(self.field_kwarg, "")
+            try:
+                value = self.__CleanValue(model, field)
+                self.BulkUpdate(queryset, pks, field, value)
+            except ValidationError as error:
+                return HttpResponseBadRequest(
+                    "; ".join(error.messages), content_type="text/plain"
+                )
+
+        return HttpResponseRedirect(self.get_success_url())
+
+    def BulkUpdate(
+        self, queryset: QuerySet[Model], pks: List[Any], field: str, value: Any
+    ) -> int:
+        model = queryset.model
+        using = router.db_for_write(model)
+        now = timezone.now()
+        values = {
+            auto_field.name: now
+            for auto_field in model._meta.concrete_fields
+            if getattr(auto_field, "auto_now", False)
+        }
+        values[field] = value
+        try:
+            with transaction.atomic(using=using):
+                updated = queryset.filter(pk__in=pks).update(**values)
+        except IntegrityError as error:
+            raise ValidationError(
+                f"The value of {field} conflicts with other objects"
+            ) from error
+
+        if updated:
+            # QuerySet.update() sends no signals for track_model
+            transaction.on_commit(
+                functools.partial(bump_model_version, model), using=using
+            )
+        return updated
+
+    def BulkDelete(
+        self, queryset: QuerySet[Model], pks: List[Any]
+    ) -> Tuple[int, List[Any]]:
+        """Delete the pks by chunks; return the count and the kept pks.
+
+        A chunk that hits a PROTECT or RESTRICT relation is deleted pk by
+        pk, and the pks still referenced are kept.
+        """
+        deleted = 0
+        kept: List[Any] = []
+        using = router.db_for_write(queryset.model)
+        for start in range(0, len(pks), self.delete_chunk_size):
+            end = start + self.delete_chunk_size
+            chunk = pks[start:end]
+            try:
+                with transaction.atomic(using=using):
+                    deleted += queryset.filter(pk__in=chunk).delete()[0]
+                continue
+            except (ProtectedError, RestrictedError):
+                pass
+            for pk in chunk:
+                try:
+                    with transaction.atomic(using=using):
+                        deleted += queryset.filter(pk=pk).delete()[0]
+                except (ProtectedError, RestrictedError):
+                    kept.append(pk)
+        return deleted, kept
+
+    def get_success_url(self) -> str:
+        if self.success_url is None:
+            return self.request.get_full_path()
+        return str(self.success_url)
+
+    def __Pks(self, model: type) -> List[Any]:
+        raw = [
+            value
+            for values in self.request.POST.getlist(self.pks_kwarg)
+            for value in values.split(",")
+            if value
+        ]
+        if not raw:
+            raise ValidationError("No objects selected")
+        if len(raw) > self.max_bulk_pks:
+            raise ValidationError(f"At most {self.max_bulk_pks} objects")
+        pk = model._meta.pk
+        return list(dict.fromkeys(pk.to_python(value) for value in raw))
+
+    def __CleanValue(self, model: type, name: str) -> Any:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist as error:
+            raise ValidationError(f"Unknown field {name}") from error
+        if not field.concrete or field.primary_key or not field.editable:
+            raise ValidationError(f"Field {name} is not bulk updatable")
+
+        form_class = modelform_class(self.__class__, model, (name,), [], None)
+        form = form_class(data=self.request.POST)
+        if not form.is_valid():
+            raise ValidationError(
+                [error for errors in form.errors.values() for error in errors]
+            )
+        return form.cleaned_data[name]
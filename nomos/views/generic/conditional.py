@@ -0,0 +1,162 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, cast
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views.generic.base import View
+from django.views.generic.detail import SingleObjectMixin
+
+from ...shortcuts import permissions_version
+
+__all__ = ["ConditionalMixin"]
+
+ConditionalState = Tuple[str, Optional[datetime]]
+
+
+class ConditionalMixin(View):
+    """Answers GET/HEAD with 304 from the last_modified_field of the model.
+
+    Detail pages read the field of the single row, lists aggregate its Max
+    and the row count (so deletions change the ETag too), all without
+    loading rows or rendering. Only the detail page sends Last-Modified:
+    a list Max does not move when an older row is deleted. Changes to
+    related rows shown in the page are seen only when they touch the
+    field. The ETag varies on the user and permissions_version, so pages
+    showing what the user may do change with the permissions.
+    """
+
+    last_modified_field: Optional[str] = None
+
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        if self.last_modified_field is None or request.method not in (
+            "GET",
+            "HEAD",
+        ):
+            return super().dispatch(request, *args, **kwargs)
+        if self.view_is_async:
+            return self.__DispatchAsync(request, *args, **kwargs)
+
+        state = self.GetConditionalState()
+        if state is not None:
+            response = self.__NotModified(state)
+            if response is not None:
+                return response
+
+        response = super().dispatch(request, *args, **kwargs)
+        return self.__Tag(response, state)
+
+    def GetConditionalState(self) -> Optional[ConditionalState]:
+        field = cast(str, self.last_modified_field)
+        queryset = cast(QuerySet[Any], cast(Any, self).get_queryset())
+
+        if isinstance(self, SingleObjectMixin):
+            lookup = self.__ObjectLookup()
+            if lookup is None:
+                return None
+            rows = list(queryset.filter(**lookup).values_list(field)[:2])
+            if len(rows) != 1:
+                return None
+            last_modified = rows[0][0]
+            values: Tuple[Any, ...] = (lookup, last_modified)
+        else:
+            aggregate = queryset.aggregate(
+                last_modified=Max(field), count=Count("pk")
+            )
+            values = (aggregate["last_modified"], aggregate["count"])
+            last_modified = None
+
+        user = getattr(self.request, "user", None)
+        view_class = self.__class__
+        etag = hashlib.sha1(
+            "\0".join(
+                (
+                    view_class.__module__,
+                    view_class.__qualname__,
+                    self.request.get_full_path(),
+                    repr(values),
+                    str(getattr(user, "pk", "")),
+                    str(getattr(user, "is_superuser", "")),
+                    str(permissions_version()),
+                    getattr(self.request, "LANGUAGE_CODE", ""),
+                )
+            ).encode()
+        ).hexdigest()
+
+        if not isinstance(last_modified, datetime):
+            last_modified = None
+        return f'W/"{etag}"', last_modified
+
+    async def __DispatchAsync(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        state = await sync_to_async(self.GetConditionalState)()
+        if state is not None:
+            response = self.__NotModified(state)
+            if response is not None:
+                return response
+
+        response = await super().dispatch(request, *args, **kwargs)
+        return self.__Tag(response, state)
+
+    def __ObjectLookup(self) -> Optional[Dict[str, Any]]:
+        view = cast(SingleObjectMixin[Any], self)
+        pk = self.kwargs.get(view.pk_url_kwarg)
+        slug = self.kwargs.get(view.slug_url_kwarg)
+        if pk is not None:
+            lookup = {"pk": pk}
+            if slug is not None and view.query_pk_and_slug:
+                lookup[view.get_slug_field()] = slug
+            return lookup
+        if slug is not None:
+            return {view.get_slug_field(): slug}
+        return None
+
+    def __NotModified(self, state: ConditionalState) -> Optional[HttpResponse]:
+        etag, last_modified = state
+        return cast(
+            Optional[HttpResponse],
+            get_conditional_response(
+                self.request,
+                etag=etag,
+                last_modified=(
+                    None
+                    if last_modified is None
+                    else int(last_modified.timestamp())
+                ),
+            ),
+        )
+
+    @staticmethod
+    def __Tag(
+        response: HttpResponse, state: Optional[ConditionalState]
+    ) -> HttpResponse:
+        if state is None or response.status_code != 200:
+            return response
+        etag, last_modified = state
+        response.headers.setdefault("ETag", etag)
+        if last_modified is not None:
+            response.headers.setdefault(
+                "Last-Modified", http_date(last_modified.timestamp())
+            )
+        return response
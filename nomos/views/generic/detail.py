@@ -19,8 +19,10 @@ from typing import Any, Dict
 
 from django.views.generic.detail import DetailView
 
+from .base import RelatedQuerySetMixin
 
-class PairFieldsMixin(DetailView):
+
+class PairFieldsMixin(RelatedQuerySetMixin, DetailView):
     def get_context_data(self, **kwargs: Dict[str, Any]) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
         obj = context["object"]
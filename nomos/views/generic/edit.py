@@ -22,6 +22,8 @@ from django.db import models
 from django.forms import models as model_forms
 from django.views.generic import edit as edit_views
 
+from .base import modelform_class
+
 __all__ = ["CreateView"]
 
 
@@ -30,6 +32,7 @@ class CreateView(edit_views.CreateView):
     formfield_callback: Optional[
         Callable[[models.Field], model_forms.Field]
     ] = None
+    cache_form_class = True
     form_class: Optional[Type[models.Model]]
 
     def get_form_class(self) -> Type[models.Model]:
@@ -52,16 +55,14 @@ class CreateView(edit_views.CreateView):
                 else self.get_queryset().model
             )
 
-            model_form = type(
-                "ModelForm", (model_forms.ModelForm, *self.form_mixins), {}
-            )
-
             return cast(
                 Type[models.Model],
-                model_forms.modelform_factory(
+                modelform_class(
+                    self.__class__,
                     model,
-                    model_form,
-                    fields=self.fields,
-                    formfield_callback=self.formfield_callback,
+                    self.fields,
+                    self.form_mixins,
+                    self.formfield_callback,
+                    self.cache_form_class,
                 ),
             )
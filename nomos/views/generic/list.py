@@ -15,17 +15,42 @@
 # You should have received a copy of the GNU General Public License along
 # with Nomos. If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, NamedTuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
-from django.db.models import Model
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import Field, Model, QuerySet
+from django.http import Http404, HttpRequest, StreamingHttpResponse
+from django.template import loader
+from django.template.base import Template
+from django.template.context import make_context
+from django.template.defaulttags import ForNode
 from django.views.generic.base import ContextMixin
 
+from ...core.paginator import InvalidCursor, KeysetPage, KeysetPaginator
+from .base import RelatedQuerySetMixin
 
-class MultipleObjectMixin(ContextMixin):
+
+class MultipleObjectMixin(RelatedQuerySetMixin, ContextMixin):
     model: Model
 
     paginate_by = 16
     fields = "__all__"
+    project_fields = False
+    projected_lookups: Dict[str, str] = {}
 
     def get_context_data(self, **kwargs: Dict[str, Any]) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -36,11 +61,22 @@ class MultipleObjectMixin(ContextMixin):
             else self.fields
         )
 
-        object_items = tuple(
-            self.Item(
-                obj.pk, tuple(getattr(obj, field) for field in object_fields)
+        object_list = context["page_obj"].object_list
+        if self.project_fields and not isinstance(object_list, QuerySet):
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__}.project_fields needs pages of"
+                " a QuerySet, keyset pagination pages are lists"
+            )
+        object_items = (
+            self.__ProjectItems(object_list, object_fields)
+            if self.project_fields
+            else tuple(
+                self.Item(
+                    obj.pk,
+                    tuple(getattr(obj, field) for field in object_fields),
+                )
+                for obj in object_list
             )
-            for obj in context["page_obj"]
         )
 
         context["object_fields"] = object_fields
@@ -48,6 +84,212 @@ class MultipleObjectMixin(ContextMixin):
 
         return context
 
+    def __ProjectItems(
+        self, queryset: QuerySet[Model], object_fields: Sequence[str]
+    ) -> Tuple["MultipleObjectMixin.Item", ...]:
+        opts = queryset.model._meta
+        lookups = []
+        relations: Dict[int, Field[Any, Any]] = {}
+
+        for i, name in enumerate(object_fields):
+            if name in self.projected_lookups:
+                lookups.append(self.projected_lookups[name])
+                continue
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist as error:
+                raise ImproperlyConfigured(
+                    f"Unprojectable list field '{name}'"
+                ) from error
+            if field.many_to_one or (field.one_to_one and field.concrete):
+                lookups.append(field.attname)
+                relations[i] = field
+            else:
+                lookups.append(name)
+
+        rows = tuple(queryset.values_list("pk", *lookups))
+
+        displays = {
+            i: field.related_model._default_manager.in_bulk(
+                {row[i + 1] for row in rows if row[i + 1] is not None},
+                field_name=field.target_field.name,
+            )
+            for i, field in relations.items()
+        }
+
+        return tuple(
+            self.Item(
+                row[0],
+                tuple(
+                    displays[i].get(value) if i in displays else value
+                    for i, value in enumerate(row[1:])
+                ),
+            )
+            for row in rows
+        )
+
     class Item(NamedTuple):
         pk: Any
         fields: Any
+
+
+class KeysetPaginationMixin(ContextMixin):
+    """Seek pagination for ListView, driven by a cursor query parameter."""
+
+    request: HttpRequest
+
+    paginate_by = 16
+    cursor_kwarg = "cursor"
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Model], page_size: int
+    ) -> Tuple[KeysetPaginator, KeysetPage, List[Model], bool]:
+        ordering = (
+            cast(Any, self).get_ordering()
+            or queryset.query.order_by
+            or queryset.model._meta.ordering
+        )
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            tuple(name for name in ordering or () if isinstance(name, str)),
+        )
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor as error:
+            raise Http404(str(error)) from error
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        page = context.get("page_obj")
+        if isinstance(page, KeysetPage):
+            context["next_link"] = self.__Link(page.next_cursor)
+            context["previous_link"] = self.__Link(page.previous_cursor)
+        return context
+
+    def __Link(self, cursor: Optional[str]) -> Optional[str]:
+        if cursor is None:
+            return None
+        query = self.request.GET.copy()
+        query[self.cursor_kwarg] = cursor
+        return f"?{query.urlencode()}"
+
+
+class StreamingListMixin(ContextMixin):
+    """Streams the list template split around its object_list loop.
+
+    The template must have a top-level {% for ... in object_list %}. The
+    text before and after the loop is rendered once and each chunk of
+    stream_chunk_size rows is sent as it is rendered. While streaming,
+    forloop only offers counter, counter0 and first. Async views stream
+    through an async iterator, each chunk rendered in a thread, as ASGI
+    handlers buffer sync iterators whole.
+    """
+
+    request: HttpRequest
+    content_type: Optional[str]
+
+    stream_chunk_size = 2000
+
+    def render_to_response(
+        self, context: Dict[str, Any], **response_kwargs: Any
+    ) -> StreamingHttpResponse:
+        template = loader.select_template(
+            cast(Any, self).get_template_names()
+        ).template
+        response_kwargs.setdefault("content_type", self.content_type)
+        chunks = self.__Stream(template, self.__Loop(template), context)
+        return StreamingHttpResponse(
+            (
+                self.__AsyncStream(chunks)
+                if getattr(self, "view_is_async", False)
+                else chunks
+            ),
+            **response_kwargs,
+        )
+
+    @staticmethod
+    async def __AsyncStream(
+        chunks: Generator[str, None, None]
+    ) -> AsyncIterator[str]:
+        step = sync_to_async(next)
+        try:
+            while True:
+                chunk = await step(chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            await sync_to_async(chunks.close)()
+
+    def __Stream(
+        self, template: Template, loop: ForNode, context_dict: Dict[str, Any]
+    ) -> Generator[str, None, None]:
+        context = make_context(context_dict, self.request)
+        nodelist = template.nodelist
+        index = nodelist.index(loop)
+        after = index + 1
+
+        with context.render_context.push_state(template):
+            with context.bind_template(template):
+                context.template_name = template.name
+                yield "".join(
+                    node.render_annotated(context) for node in nodelist[:index]
+                )
+                yield from self.__StreamLoop(loop, context)
+                yield "".join(
+                    node.render_annotated(context) for node in nodelist[after:]
+                )
+
+    def __StreamLoop(self, loop: ForNode, context: Any) -> Iterator[str]:
+        object_list = context.get("object_list")
+        rows: Iterable[Any]
+        if object_list is None:
+            rows = ()
+        elif isinstance(object_list, QuerySet):
+            # never tested for truth: that would fetch the rows twice
+            rows = object_list.iterator(chunk_size=self.stream_chunk_size)
+        else:
+            rows = object_list
+        if loop.is_reversed:
+            rows = reversed(list(rows))
+
+        chunk: List[str] = []
+        empty = True
+        with context.push():
+            for i, row in enumerate(rows):
+                empty = False
+                if len(loop.loopvars) > 1:
+                    for name, value in zip(loop.loopvars, row):
+                        context[name] = value
+                else:
+                    context[loop.loopvars[0]] = row
+                context["forloop"] = {
+                    "counter0": i,
+                    "counter": i + 1,
+                    "first": i == 0,
+                    "parentloop": {},
+                }
+                chunk.append(loop.nodelist_loop.render(context))
+                if len(chunk) >= self.stream_chunk_size:
+                    yield "".join(chunk)
+                    chunk = []
+            if empty:
+                chunk.append(loop.nodelist_empty.render(context))
+        yield "".join(chunk)
+
+    @staticmethod
+    def __Loop(template: Template) -> ForNode:
+        for node in template.nodelist:
+            if (
+                isinstance(node, ForNode)
+                and node.sequence.token == "object_list"
+            ):
+                return node
+        raise ImproperlyConfigured(
+            f"Streaming template {template.name} has no top-level"
+            " {% for ... in object_list %} loop"
+        )
@@ -15,11 +15,17 @@
 # You should have received a copy of the GNU General Public License along
 # with Nomos. If not, see <https://www.gnu.org/licenses/>.
 
+import functools
+import re
+import threading
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
+    Hashable,
     List,
+    Literal,
     NamedTuple,
     Optional,
     Tuple,
@@ -30,6 +36,7 @@ from typing import (
 )
 
 from django import urls
+from django.core.paginator import Paginator
 from django.db.models import Model
 from django.forms import ModelForm
 from django.views.generic.base import ContextMixin, View
@@ -37,7 +44,36 @@ from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from django.views.generic.list import ListView
 
-__all__ = ["menuviews_factory", "MenuViews", "ViewTraits", "MenuTraits"]
+from ...core.cache import related_models, track_model
+from ...core.paginator import count_paginators
+from .asynchronous import (
+    AsyncCreateView,
+    AsyncDeleteView,
+    AsyncDetailView,
+    AsyncDispatchMixin,
+    AsyncListView,
+    AsyncUpdateView,
+)
+from .base import RelatedQuerySetMixin, SharedFormClassMixin
+from .bulk import BulkActionView, ExportView, ImportView
+from .conditional import ConditionalMixin
+from .list import KeysetPaginationMixin, StreamingListMixin
+from .pagecache import PageCacheMixin
+
+__all__ = [
+    "menuviews",
+    "menuviews_factory",
+    "menuviews_registrations",
+    "register_menuviews",
+    "pk_url_name",
+    "dispatch_attrs",
+    "track_menu_models",
+    "MenuViews",
+    "ViewTraits",
+    "MenuTraits",
+    "MenuUrls",
+    "PatternUrl",
+]
 
 
 class MenuViews(NamedTuple):
@@ -46,6 +82,9 @@ class MenuViews(NamedTuple):
     detail: Type[DetailView[Model]]
     update: Type[UpdateView[Model, ModelForm[Model]]]
     delete: Type[DeleteView[Model, ModelForm[Model]]]
+    export: Optional[Type[ExportView]] = None
+    import_: Optional[Type[ImportView]] = None
+    bulk: Optional[Type[BulkActionView]] = None
 
 
 class MenuAfterPatterns(NamedTuple):
@@ -55,6 +94,14 @@ class MenuAfterPatterns(NamedTuple):
 
 class ViewTraits(NamedTuple):
     bases: Tuple[Type[object], ...] = ()
+    select_related: Optional[Tuple[str, ...]] = None
+    prefetch_related: Tuple[str, ...] = ()
+    pagination: Literal["offset", "keyset"] = "offset"
+    paginate_by: Optional[int] = None
+    count_strategy: Literal["exact", "cached", "estimated", "none"] = "exact"
+    stream: bool = False
+    cache_timeout: Optional[int] = None
+    last_modified_field: Optional[str] = None
 
 
 class MenuTraits(NamedTuple):
@@ -63,6 +110,102 @@ class MenuTraits(NamedTuple):
     detail: ViewTraits = ViewTraits()
     update: ViewTraits = ViewTraits()
     delete: ViewTraits = ViewTraits()
+    export: Optional[ViewTraits] = None
+    import_: Optional[ViewTraits] = None
+    bulk: Optional[ViewTraits] = None
+
+
+_menuviews: Dict[Hashable, MenuViews] = {}
+_menuviews_lock = threading.Lock()
+_menuviews_builds: Dict[Hashable, Callable[[], MenuViews]] = {}
+
+
+def register_menuviews(key: Hashable, build: Callable[[], MenuViews]) -> None:
+    """Record a deferred menuviews() call for warmup.
+
+    A urlconf imported again replaces its registrations under the same
+    key instead of adding new ones.
+    """
+    _menuviews_builds[key] = build
+
+
+def menuviews_registrations() -> Tuple[Callable[[], MenuViews], ...]:
+    return tuple(_menuviews_builds.values())
+
+
+def menuviews(
+    model: Type[Model],
+    template_basedir: str,
+    patterns_prefix: str,
+    menu_traits: MenuTraits,
+    asynchronous: bool = False,
+) -> MenuViews:
+    """Build the menu views once per distinct factory arguments."""
+    key = (model, template_basedir, patterns_prefix, menu_traits, asynchronous)
+    try:
+        views = _menuviews.get(key)
+    except TypeError:
+        return menuviews_factory(
+            model, template_basedir, patterns_prefix, menu_traits, asynchronous
+        )
+
+    if views is None:
+        with _menuviews_lock:
+            views = _menuviews.get(key)
+            if views is None:
+                views = _menuviews[key] = menuviews_factory(
+                    model,
+                    template_basedir,
+                    patterns_prefix,
+                    menu_traits,
+                    asynchronous,
+                )
+    return views
+
+
+def pk_url_name(model: Type[Model]) -> str:
+    if model._meta.object_name is None:
+        raise ValueError("Unsupported model _meta with none object_name")
+    return f"{model._meta.object_name.lower()}_id"
+
+
+def dispatch_attrs(menu_traits: MenuTraits, name: str) -> Dict[str, Any]:
+    """Decorator attributes of the dispatch of the name view bases.
+
+    as_view() copies them (csrf_exempt) onto the view function; this
+    finds them without building the view class.
+    """
+    traits = getattr(menu_traits, name) or ViewTraits()
+    bases = traits.bases
+    if name == "export":
+        bases = (*menu_traits.list.bases, *bases)
+    elif name == "import_":
+        bases = (*menu_traits.create.bases, *bases)
+
+    for base in bases:
+        for klass in base.__mro__:
+            dispatch = vars(klass).get("dispatch")
+            if dispatch is not None:
+                return dict(getattr(dispatch, "__dict__", {}))
+    return {}
+
+
+def track_menu_models(model: Type[Model], menu_traits: MenuTraits) -> None:
+    """Connect the version signals of the models cached by the menu.
+
+    Done when the menu is routed, not on first use, so every process
+    bumps the versions even before it serves the cached views.
+    """
+    models: List[Type[Model]] = []
+    if menu_traits.list.count_strategy == "cached":
+        models.append(model)
+    if (
+        menu_traits.list.cache_timeout is not None
+        or menu_traits.detail.cache_timeout is not None
+    ):
+        models.extend(related_models(model))
+    for tracked in dict.fromkeys(models):
+        track_model(tracked)
 
 
 def menuviews_factory(
@@ -70,13 +213,15 @@ def menuviews_factory(
     template_basedir: str,
     patterns_prefix: str,
     menu_traits: MenuTraits,
+    asynchronous: bool = False,
 ) -> MenuViews:
+    track_menu_models(model, menu_traits)
     after_patterns = MenuAfterPatterns(
         f"{patterns_prefix}:list",
         f"{patterns_prefix}:detail",
     )
     factory = __MenuFactory(
-        template_basedir, model, after_patterns, menu_traits
+        template_basedir, model, after_patterns, menu_traits, asynchronous
     )
     return MenuViews(
         factory.MakeListView(),
@@ -84,6 +229,9 @@ def menuviews_factory(
         factory.MakeDetailView(),
         factory.MakeUpdateView(),
         factory.MakeDeleteView(),
+        factory.MakeExportView() if menu_traits.export else None,
+        factory.MakeImportView() if menu_traits.import_ else None,
+        factory.MakeBulkActionView() if menu_traits.bulk else None,
     )
 
 
@@ -94,6 +242,89 @@ class _AttrsDict(TypedDict, total=False):
     success_pattern: Optional[str]
     fields: Optional[Union[str, List[str]]]
     pk_url_kwarg: Optional[str]
+    select_related: Optional[Tuple[str, ...]]
+    prefetch_related: Tuple[str, ...]
+    paginate_by: int
+    paginator_class: Type[Paginator]
+    cache_timeout: int
+    last_modified_field: str
+
+
+class PatternUrl:
+    """Reverses a single-pk pattern by formatting a precompiled path.
+
+    The pattern is reversed once per script prefix and urlconf with a
+    sentinel pk and split around it. Keys that a converter may render
+    differently fall back to urls.reverse.
+    """
+
+    __slots__ = "name", "__parts"
+
+    do_not_call_in_templates = True
+
+    SENTINELS = (
+        ("4815162342", re.compile(r"[0-9]+", re.ASCII)),
+        ("sk4815162342", re.compile(r"[-\w]+", re.ASCII)),
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.__parts: Dict[
+            Tuple[str, Any], Optional[Tuple[str, str, re.Pattern[str]]]
+        ] = {}
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __call__(self, pk: Any) -> str:
+        key = str(pk)
+        parts = self.__Parts()
+        if parts is None or not parts[2].fullmatch(key):
+            return urls.reverse(self.name, args=[pk])
+        return f"{parts[0]}{key}{parts[1]}"
+
+    def __Parts(self) -> Optional[Tuple[str, str, re.Pattern[str]]]:
+        scope = (urls.get_script_prefix(), urls.get_urlconf())
+        try:
+            return self.__parts[scope]
+        except KeyError:
+            pass
+
+        parts = None
+        for sentinel, accepted in reversed(self.SENTINELS):
+            try:
+                path = urls.reverse(self.name, args=[sentinel])
+            except urls.NoReverseMatch:
+                continue
+            if path.count(sentinel) == 1:
+                head, _, tail = path.partition(sentinel)
+                parts = (head, tail, accepted)
+            break
+
+        self.__parts[scope] = parts
+        return parts
+
+
+class MenuUrls(NamedTuple):
+    detail: PatternUrl
+    update: PatternUrl
+    delete: PatternUrl
+
+
+@functools.lru_cache(maxsize=1024)
+def menu_context(name: str) -> Dict[str, Any]:
+    return {
+        "list_name": f"{name}:list",
+        "create_name": f"{name}:create",
+        "detail_name": f"{name}:detail",
+        "update_name": f"{name}:update",
+        "delete_name": f"{name}:delete",
+        "urls": MenuUrls(
+            PatternUrl(f"{name}:detail"),
+            PatternUrl(f"{name}:update"),
+            PatternUrl(f"{name}:delete"),
+        ),
+    }
 
 
 class MenuMixin(ContextMixin, View):
@@ -104,13 +335,7 @@ class MenuMixin(ContextMixin, View):
             raise ValueError("request.resolver_match is None")
 
         name = self.request.resolver_match.app_name
-        context["menu"] = {
-            "list_name": f"{name}:list",
-            "create_name": f"{name}:create",
-            "detail_name": f"{name}:detail",
-            "update_name": f"{name}:update",
-            "delete_name": f"{name}:delete",
-        }
+        context["menu"] = dict(menu_context(name))
 
         return context
 
@@ -122,38 +347,54 @@ class __MenuFactory:
         model: Type[Model],
         after_patterns: MenuAfterPatterns,
         menu_traits: MenuTraits,
+        asynchronous: bool = False,
     ):
-        if model._meta.object_name is None:
-            raise ValueError("Unsupported model _meta with none object_name")
-
+        self.pk_url_name = pk_url_name(model)
         self.template_basedir = Path(template_basedir)
         self.model = model
-        self.model_name = model._meta.object_name
-        self.pk_url_name = f"{self.model_name.lower()}_id"
+        self.model_name = cast(str, model._meta.object_name)
         self.after_patterns = after_patterns
         self.menu_traits = menu_traits
+        self.asynchronous = asynchronous
 
     def MakeListView(self) -> Type[ListView[Model]]:
+        traits = self.menu_traits.list
+        attrs: _AttrsDict = {
+            "template_name": self.__NameTemplate("list"),
+            "model": self.model,
+            "select_related": traits.select_related,
+            "prefetch_related": traits.prefetch_related,
+        }
+        if traits.paginate_by is not None:
+            attrs["paginate_by"] = traits.paginate_by
+        if traits.count_strategy != "exact":
+            attrs["paginator_class"] = count_paginators[traits.count_strategy]
+        if traits.cache_timeout is not None:
+            attrs["cache_timeout"] = traits.cache_timeout
+        if traits.last_modified_field is not None:
+            attrs["last_modified_field"] = traits.last_modified_field
+
         return self.__TypeView(
             self.__NameView("List"),
             (
-                *self.menu_traits.list.bases,
+                *self.__Bases(traits),
+                *self.__HttpCacheMixins(traits),
                 MenuMixin,
-                ListView,
+                *self.__ListMixins(),
+                RelatedQuerySetMixin,
+                AsyncListView if self.asynchronous else ListView,
             ),
-            {
-                "template_name": self.__NameTemplate("list"),
-                "model": self.model,
-            },
+            attrs,
         )
 
     def MakeCreateView(self) -> Type[CreateView[Model, ModelForm[Model]]]:
         return self.__TypeView(
             self.__NameView("Create"),
             (
-                *self.menu_traits.create.bases,
+                *self.__Bases(self.menu_traits.create),
                 MenuMixin,
-                CreateView,
+                SharedFormClassMixin,
+                AsyncCreateView if self.asynchronous else CreateView,
             ),
             {
                 "template_name": self.__NameTemplate("create"),
@@ -164,27 +405,39 @@ class __MenuFactory:
         )
 
     def MakeDetailView(self) -> Type[DetailView[Model]]:
+        traits = self.menu_traits.detail
+        attrs: _AttrsDict = {
+            "template_name": self.__NameTemplate("detail"),
+            "model": self.model,
+            "pk_url_kwarg": self.pk_url_name,
+            "select_related": traits.select_related,
+            "prefetch_related": traits.prefetch_related,
+        }
+        if traits.cache_timeout is not None:
+            attrs["cache_timeout"] = traits.cache_timeout
+        if traits.last_modified_field is not None:
+            attrs["last_modified_field"] = traits.last_modified_field
+
         return self.__TypeView(
             self.__NameView("Detail"),
             (
-                *self.menu_traits.detail.bases,
+                *self.__Bases(traits),
+                *self.__HttpCacheMixins(traits),
                 MenuMixin,
-                DetailView,
+                RelatedQuerySetMixin,
+                AsyncDetailView if self.asynchronous else DetailView,
             ),
-            {
-                "template_name": self.__NameTemplate("detail"),
-                "model": self.model,
-                "pk_url_kwarg": self.pk_url_name,
-            },
+            attrs,
         )
 
     def MakeUpdateView(self) -> Type[UpdateView[Model, ModelForm[Model]]]:
         return self.__TypeView(
             self.__NameView("Update"),
             (
-                *self.menu_traits.update.bases,
+                *self.__Bases(self.menu_traits.update),
                 MenuMixin,
-                _UpdateView,
+                SharedFormClassMixin,
+                _AsyncUpdateView if self.asynchronous else _UpdateView,
             ),
             {
                 "template_name": self.__NameTemplate("update"),
@@ -199,9 +452,9 @@ class __MenuFactory:
         return self.__TypeView(
             self.__NameView("Delete"),
             (
-                *self.menu_traits.delete.bases,
+                *self.__Bases(self.menu_traits.delete),
                 MenuMixin,
-                DeleteView,
+                AsyncDeleteView if self.asynchronous else DeleteView,
             ),
             {
                 "template_name": self.__NameTemplate("delete"),
@@ -211,6 +464,69 @@ class __MenuFactory:
             },
         )
 
+    def MakeExportView(self) -> Type[ExportView]:
+        traits = self.menu_traits.export or ViewTraits()
+        return self.__TypeView(
+            self.__NameView("Export"),
+            (
+                *self.menu_traits.list.bases,
+                *traits.bases,
+                ExportView,
+            ),
+            {"model": self.model},
+        )
+
+    def MakeImportView(self) -> Type[ImportView]:
+        traits = self.menu_traits.import_ or ViewTraits()
+        return self.__TypeView(
+            self.__NameView("Import"),
+            (
+                *self.menu_traits.create.bases,
+                *traits.bases,
+                MenuMixin,
+                ImportView,
+            ),
+            {
+                "template_name": self.__NameTemplate("import"),
+                "model": self.model,
+                "fields": "__all__",
+            },
+        )
+
+    def MakeBulkActionView(self) -> Type[BulkActionView]:
+        traits = self.menu_traits.bulk or ViewTraits()
+        return self.__TypeView(
+            self.__NameView("BulkAction"),
+            (*traits.bases, BulkActionView),
+            {
+                "model": self.model,
+                "success_url": urls.reverse_lazy(self.after_patterns.create),
+            },
+        )
+
+    def __Bases(self, traits: ViewTraits) -> Tuple[Type[object], ...]:
+        if self.asynchronous and traits.bases:
+            return (AsyncDispatchMixin, *traits.bases)
+        return traits.bases
+
+    @staticmethod
+    def __HttpCacheMixins(traits: ViewTraits) -> Tuple[Type[object], ...]:
+        mixins: List[Type[object]] = []
+        if traits.last_modified_field is not None:
+            mixins.append(ConditionalMixin)
+        if traits.cache_timeout is not None:
+            mixins.append(PageCacheMixin)
+        return tuple(mixins)
+
+    def __ListMixins(self) -> Tuple[Type[object], ...]:
+        traits = self.menu_traits.list
+        mixins: List[Type[object]] = []
+        if traits.stream:
+            mixins.append(StreamingListMixin)
+        if traits.pagination == "keyset":
+            mixins.append(KeysetPaginationMixin)
+        return tuple(mixins)
+
     def __NameView(self, viewname: str) -> str:
         return f"{self.model_name}{viewname}View"
 
@@ -233,3 +549,7 @@ class _UpdateView(UpdateView[Model, ModelForm[Model]]):
         return urls.reverse(
             self.success_pattern, args=[self.kwargs[self.pk_url_kwarg]]
         )
+
+
+class _AsyncUpdateView(_UpdateView, AsyncUpdateView):
+    pass
@@ -0,0 +1,135 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+from typing import Any, List, Optional, Type, cast
+
+from asgiref.sync import sync_to_async
+from django.db.models import Model
+from django.http import HttpRequest, HttpResponse
+from django.template.response import SimpleTemplateResponse
+from django.views.generic.base import View
+
+from ...core.cache import model_version, nomos_cache, related_models
+from ...shortcuts import PermissionNames, permission_snapshot
+
+__all__ = ["PageCacheMixin"]
+
+
+class PageCacheMixin(View):
+    """Caches the rendered GET page under the versions of its models.
+
+    The key varies on the full path (page, cursor, ordering), the URL
+    kwargs, the language and the menu permissions of the user. Writes
+    to the view model or to the models of its forward relations bump
+    their version (see track_model), so stale pages are never read again
+    and simply expire. Pages that used the CSRF token are not stored.
+    """
+
+    cache_timeout: Optional[int] = None
+
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        if self.cache_timeout is None or request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+        if self.view_is_async:
+            return self.__DispatchAsync(request, *args, **kwargs)
+
+        key = self.PageCacheKey()
+        cached = nomos_cache().get(key)
+        if cached is not None:
+            return self.__Hit(cached)
+
+        response = super().dispatch(request, *args, **kwargs)
+        self.__Store(key, response)
+        return response
+
+    def CacheModels(self) -> List[Type[Model]]:
+        model = getattr(self, "model", None)
+        if model is None:
+            model = cast(Any, self).get_queryset().model
+        return related_models(model)
+
+    def PageCacheKey(self) -> str:
+        models = self.CacheModels()
+        versions = ".".join(str(model_version(model)) for model in models)
+
+        names = PermissionNames.Make(models[0])
+        snapshot = permission_snapshot(self.request)
+        perms = "".join(
+            "1" if snapshot.has_perms(required) else "0"
+            for required in (
+                names.list,
+                names.create,
+                names.detail,
+                names.update,
+                names.delete,
+            )
+        )
+
+        view_class = self.__class__
+        variant = hashlib.sha1(
+            "\0".join(
+                (
+                    view_class.__module__,
+                    view_class.__qualname__,
+                    self.request.get_full_path(),
+                    repr(sorted(self.kwargs.items())),
+                    getattr(self.request, "LANGUAGE_CODE", ""),
+                    perms,
+                )
+            ).encode()
+        ).hexdigest()
+        label = models[0]._meta.label_lower
+        return f"nomos:page:{label}:{versions}:{variant}"
+
+    async def __DispatchAsync(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        key = await sync_to_async(self.PageCacheKey)()
+        cached = await nomos_cache().aget(key)
+        if cached is not None:
+            return self.__Hit(cached)
+
+        response = await super().dispatch(request, *args, **kwargs)
+        self.__Store(key, response)
+        return response
+
+    def __Store(self, key: str, response: HttpResponse) -> None:
+        if response.status_code != 200 or getattr(
+            response, "streaming", False
+        ):
+            return
+
+        def store(response: HttpResponse) -> None:
+            if self.request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+                return
+            nomos_cache().set(
+                key,
+                (response.content, response["Content-Type"]),
+                self.cache_timeout,
+            )
+
+        if isinstance(response, SimpleTemplateResponse):
+            if not response.is_rendered:
+                response.add_post_render_callback(store)
+                return
+        store(response)
+
+    @staticmethod
+    def __Hit(cached: Any) -> HttpResponse:
+        content, content_type = cached
+        return HttpResponse(content, content_type=content_type)
@@ -16,18 +16,42 @@
 # with Nomos. If not, see <https://www.gnu.org/licenses/>.
 
 
-from typing import Any, Dict, Final, List
+import contextlib
+import functools
+from typing import Any, Dict, Final, List, NamedTuple, Optional, Sequence, Type
 
 from django import forms
-from django.db import models
-from django.http import HttpRequest, HttpResponse
-from django.views.generic.edit import FormView
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models, router, transaction
+from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
+from django.views.generic.edit import FormView, ModelFormMixin
 
-__all__ = ("CompleteView", "StepView")
+from ...core.cache import bump_model_version
+from ...core.sequence import SequenceStorage, SessionSequenceStorage
+
+__all__ = ("CompleteView", "InlineSequence", "InlineStepView", "StepView")
+
+
+class InlineSequence(NamedTuple):
+    """Child rows of the sequence object, collected by an InlineStepView.
+
+    fk_name defaults to the only ForeignKey of model to the parent.
+    """
+
+    model: Type[models.Model]
+    key: str
+    fields: Sequence[str]
+    fk_name: Optional[str] = None
+    extra: int = 1
 
 
 class SequenceView(FormView[forms.ModelForm[models.Model]]):
     sequence_key: Final[str] = "sequence"
+    sequence_storage_class: Type[SequenceStorage] = SessionSequenceStorage
+    sequence_ttl: Optional[int] = None
+
+    sequence: SequenceStorage
 
     def _Data(self, form: forms.ModelForm[models.Model]) -> Dict[str, Any]:
         return forms.model_to_dict(form.instance)
@@ -36,28 +60,185 @@ class SequenceView(FormView[forms.ModelForm[models.Model]]):
         self, request: HttpRequest, *args: List[Any], **kwargs: Dict[str, Any]
     ) -> None:
         super().setup(request, *args, **kwargs)
-        request.session.setdefault(self.sequence_key, {})
+        ttl = self.sequence_ttl
+        if ttl is None:
+            ttl = getattr(settings, "NOMOS_SEQUENCE_TTL", 86400)
+        self.sequence = self.sequence_storage_class(
+            request, self.sequence_key, ttl
+        )
+
+    def dispatch(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        response = super().dispatch(request, *args, **kwargs)
+        self.sequence.Save(response)
+        return response
 
     def get_initial(self) -> Dict[str, Any]:
-        return self.request.session.get(self.sequence_key, {})
+        return dict(self.sequence.Load())
 
 
 class StepView(SequenceView):
     def form_valid(self, form: forms.ModelForm[models.Model]) -> HttpResponse:
         data = self._Data(form)
-        step = self.request.session[self.sequence_key]
         if form._meta.fields is None:
             raise ValueError("No fields on step view")
-        step.update({field: data[field] for field in form._meta.fields})
-        self.request.session[self.sequence_key] = step
+        self.sequence.Update(
+            {field: data[field] for field in form._meta.fields}
+        )
         return super().form_valid(form)
 
 
+class InlineStepView(StepView):
+    """Step storing the rows of an inline formset besides its form."""
+
+    inline: InlineSequence
+
+    def get_formset_class(self) -> Type[forms.BaseFormSet]:
+        return forms.formset_factory(
+            forms.modelform_factory(
+                self.inline.model, fields=list(self.inline.fields)
+            ),
+            extra=self.inline.extra,
+            can_delete=True,
+        )
+
+    def get_formset(self) -> forms.BaseFormSet:
+        kwargs: Dict[str, Any] = {
+            "prefix": self.inline.key,
+            "initial": self.sequence.Load().get(self.inline.key, []),
+        }
+        if self.request.method in ("POST", "PUT"):
+            kwargs["data"] = self.request.POST
+            kwargs["files"] = self.request.FILES
+        return self.get_formset_class()(**kwargs)
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        if "formset" not in kwargs:
+            kwargs["formset"] = self.get_formset()
+        return super().get_context_data(**kwargs)
+
+    def post(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        form = self.get_form()
+        formset = self.get_formset()
+        if not (form.is_valid() and formset.is_valid()):
+            return self.render_to_response(
+                self.get_context_data(form=form, formset=formset)
+            )
+
+        initial_count = formset.initial_form_count()
+        rows = []
+        for i, row_form in enumerate(formset.forms):
+            if row_form.cleaned_data.get("DELETE"):
+                continue
+            if i < initial_count or row_form.has_changed():
+                data = self._Data(row_form)
+                rows.append(
+                    {field: data[field] for field in self.inline.fields}
+                )
+        self.sequence.Update({self.inline.key: rows})
+
+        return self.form_valid(form)
+
+
 class CompleteView(SequenceView):
+    """Replays the sequence values into the form instance.
+
+    With inlines, the instance is saved once and the child rows of each
+    InlineSequence are bulk created in the same transaction, without
+    save() calls or signals per child. The sequence is cleared after,
+    and a ModelFormMixin in the subclass does not save the form again.
+    """
+
+    inlines: Sequence[InlineSequence] = ()
+    inline_batch_size: Optional[int] = None
+
+    object: Optional[models.Model] = None
+
     def form_valid(self, form: forms.ModelForm[models.Model]) -> HttpResponse:
-        lastep = self.request.session[self.sequence_key]
+        lastep = self.sequence.Load()
         for field in form.instance._meta.fields:
             if field.name not in lastep:
                 continue
             field.save_form_data(form.instance, lastep[field.name])
+        if self.inlines:
+            self.Complete(form, lastep)
+            self.sequence.Clear()
+            if isinstance(self, ModelFormMixin):
+                return HttpResponseRedirect(self.get_success_url())
         return super().form_valid(form)
+
+    def Complete(
+        self, form: forms.ModelForm[models.Model], values: Dict[str, Any]
+    ) -> models.Model:
+        databases = dict.fromkeys(
+            [
+                router.db_for_write(
+                    type(form.instance), instance=form.instance
+                ),
+                *(
+                    router.db_for_write(inline.model)
+                    for inline in self.inlines
+                ),
+            ]
+        )
+        with contextlib.ExitStack() as stack:
+            for using in databases:
+                stack.enter_context(transaction.atomic(using=using))
+            parent = form.save()
+            for inline in self.inlines:
+                fk = self.__ForeignKey(inline, parent)
+                children = [
+                    self.__Child(inline.model, fk, parent, row)
+                    for row in values.get(inline.key, ())
+                ]
+                inline.model._default_manager.bulk_create(
+                    children, batch_size=self.inline_batch_size
+                )
+                if children:
+                    # bulk_create sends no signals for track_model
+                    transaction.on_commit(
+                        functools.partial(bump_model_version, inline.model),
+                        using=router.db_for_write(inline.model),
+                    )
+        self.object = parent
+        return parent
+
+    @staticmethod
+    def __ForeignKey(
+        inline: InlineSequence, parent: models.Model
+    ) -> models.Field[Any, Any]:
+        if inline.fk_name is not None:
+            return inline.model._meta.get_field(inline.fk_name)
+
+        parents = (type(parent), parent._meta.concrete_model)
+        fks = [
+            field
+            for field in inline.model._meta.fields
+            if field.many_to_one and field.remote_field.model in parents
+        ]
+        if len(fks) != 1:
+            raise ImproperlyConfigured(
+                f"Set fk_name of the {inline.model.__name__} inline sequence."
+            )
+        return fks[0]
+
+    @staticmethod
+    def __Child(
+        model: Type[models.Model],
+        fk: models.Field[Any, Any],
+        parent: models.Model,
+        row: Dict[str, Any],
+    ) -> models.Model:
+        child = model()
+        for field in model._meta.concrete_fields:
+            if field.primary_key or field is fk or field.name not in row:
+                continue
+            if field.is_relation:
+                setattr(child, field.attname, row[field.name])
+            else:
+                field.save_form_data(child, row[field.name])
+        setattr(child, fk.name, parent)
+        return child
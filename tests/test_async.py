@@ -0,0 +1,94 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, TestCase
+
+from nomos.views.generic.asynchronous import AsyncCreateView
+from tests.demo.models import Author, Book
+
+
+class AsyncBookCreate(AsyncCreateView):
+    model = Book
+    fields = ("title", "author")
+    template_name = "demo/create.html"
+    success_url = "/"
+
+    async def form_valid(self, form: Any) -> HttpResponse:
+        form.instance.title += " (async)"
+        return await super().form_valid(form)
+
+
+class SyncOverrideBookCreate(AsyncBookCreate):
+    def form_valid(self, form: Any) -> Any:
+        form.instance.body = Book.objects.count() * "x"
+        return super().form_valid(form)
+
+
+class AsyncMenuTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = get_user_model().objects.create_user("ann")
+        cls.user.user_permissions.add(
+            Permission.objects.get(codename="view_book")
+        )
+        cls.author = Author.objects.create(name="ann")
+        cls.book = Book.objects.create(title="t0", author=cls.author)
+
+    async def test_list_with_sync_permission_bases(self) -> None:
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get("/abooks/list/")
+        self.assertEqual(response.content.decode().strip(), "t0,False")
+
+    async def test_detail_with_sync_permission_bases(self) -> None:
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(
+            f"/abooks/{self.book.pk}/detail/"
+        )
+        self.assertEqual(response.content.decode().strip(), "t0:False")
+
+    async def test_anonymous_is_redirected(self) -> None:
+        response = await self.async_client.get("/abooks/list/")
+        self.assertEqual(response.status_code, 302)
+
+    async def test_async_form_valid_override(self) -> None:
+        request = AsyncRequestFactory().post(
+            "/", {"title": "t1", "author": self.author.pk}
+        )
+        response = await AsyncBookCreate.as_view()(request)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            await Book.objects.filter(title="t1 (async)").aexists()
+        )
+
+    async def test_sync_form_valid_override(self) -> None:
+        request = AsyncRequestFactory().post(
+            "/", {"title": "t2", "author": self.author.pk}
+        )
+        response = await SyncOverrideBookCreate.as_view()(request)
+        self.assertEqual(response.status_code, 302)
+        book = await Book.objects.aget(title="t2 (async)")
+        self.assertEqual(book.body, "x")
+
+    def test_sync_list_matches(self) -> None:
+        self.client.force_login(self.user)
+        response = self.client.get("/books/list/")
+        self.assertEqual(response.content.decode().strip(), "t0,False")
@@ -0,0 +1,138 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any, Dict
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.views.generic import ListView
+
+from nomos.core.cache import model_version
+from nomos.views.generic.bulk import BulkActionView
+from nomos.views.generic.conditional import ConditionalMixin
+from tests.demo.models import Author, Book, Review, Tag
+
+
+class BookBulk(BulkActionView):
+    model = Book
+    success_url = "/"
+    delete_chunk_size = 2
+
+
+class TagBulk(BulkActionView):
+    model = Tag
+    success_url = "/"
+
+
+class BookList(ConditionalMixin, ListView):  # type: ignore[misc]
+    model = Book
+    template_name = "demo/list.html"
+    last_modified_field = "updated_at"
+
+
+class BulkActionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = get_user_model().objects.create_superuser("root")
+        author = Author.objects.create(name="ann")
+        cls.books = [
+            Book.objects.create(title=f"t{i}", author=author) for i in range(4)
+        ]
+        Review.objects.create(book=cls.books[1])
+
+    def Post(self, view_class: type, data: Dict[str, Any]) -> HttpResponse:
+        request = RequestFactory().post("/", data)
+        request.user = self.user
+        return view_class.as_view()(request)
+
+    def test_protected_objects_are_kept(self) -> None:
+        pks = ",".join(str(book.pk) for book in self.books)
+        response = self.Post(BookBulk, {"action": "delete", "pks": pks})
+        self.assertEqual(response.status_code, 409)
+        self.assertIn(str(self.books[1].pk).encode(), response.content)
+        self.assertEqual(
+            list(Book.objects.values_list("pk", flat=True)),
+            [self.books[1].pk],
+        )
+
+    def test_unique_update_is_a_bad_request(self) -> None:
+        tags = [Tag.objects.create(name=name) for name in ("a", "b")]
+        response = self.Post(
+            TagBulk,
+            {
+                "action": "update",
+                "pks": ",".join(str(tag.pk) for tag in tags),
+                "field": "name",
+                "name": "c",
+            },
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            sorted(Tag.objects.values_list("name", flat=True)), ["a", "b"]
+        )
+
+    def test_update_bumps_model_version(self) -> None:
+        version = model_version(Book)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.Post(
+                BookBulk,
+                {
+                    "action": "update",
+                    "pks": str(self.books[0].pk),
+                    "field": "title",
+                    "title": "new",
+                },
+            )
+        self.assertEqual(response.status_code, 302)
+        self.assertNotEqual(model_version(Book), version)
+
+    def test_update_changes_list_etag(self) -> None:
+        def etag() -> str:
+            request = RequestFactory().get("/")
+            request.user = self.user
+            return str(BookList.as_view()(request).headers["ETag"])
+
+        before = etag()
+        response = self.Post(
+            BookBulk,
+            {
+                "action": "update",
+                "pks": str(self.books[0].pk),
+                "field": "title",
+                "title": "new",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertNotEqual(etag(), before)
+
+    def test_errors_are_plain_text(self) -> None:
+        response = self.Post(
+            BookBulk,
+            {
+                "action": "update",
+                "pks": str(self.books[0].pk),
+                "field": "<script>",
+            },
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response["Content-Type"], "text/plain")
+
+        pks = ",".join(str(book.pk) for book in self.books)
+        response = self.Post(BookBulk, {"action": "delete", "pks": pks})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response["Content-Type"], "text/plain")
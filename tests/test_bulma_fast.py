@@ -0,0 +1,115 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import itertools
+from typing import Iterator, List
+from unittest import mock
+
+from django import forms
+from django.forms.renderers import DjangoTemplates
+from django.template.base import Template
+from django.test import TestCase, override_settings
+from django.utils.safestring import mark_safe
+
+from nomos.contrib.bulma.forms import (
+    CharField,
+    Form,
+    ModelChoiceField,
+    Select,
+    TextInput,
+)
+from nomos.forms.renderers import AppDjangoTemplates
+from tests.demo.models import Author
+
+GROUPS = [
+    ("", "---"),
+    ("<Libros>", [("1", "Dune & co"), ("2", mark_safe("<b>Emma</b>"))]),
+    ("Otros", [("3", '"Quoted"')]),
+]
+
+
+class BookForm(Form):
+    title = CharField(
+        max_length=20,
+        widget=TextInput(attrs={"placeholder": "<título>", "size": 40}),
+    )
+    subtitle = CharField(
+        required=False,
+        widget=TextInput(attrs={"autofocus": True, "disabled": False}),
+    )
+    note = CharField(required=False, initial=mark_safe("<i>safe</i>"))
+    author = ModelChoiceField(queryset=Author.objects.order_by("pk"))
+    shelf = forms.ChoiceField(
+        choices=GROUPS, widget=Select(attrs={"data-n": 3})
+    )
+
+
+class BookPlainForm(BookForm):
+    # rendered by its templates either way
+    plain = forms.IntegerField(required=False)
+
+
+class FastRenderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = Author.objects.create(name="Frank <Herbert>")
+        Author.objects.create(name='Jane "Austen"')
+
+    def Forms(self) -> Iterator[Form]:
+        yield BookPlainForm()
+        yield BookPlainForm(initial={"title": "Dune", "shelf": "2"})
+        yield BookPlainForm(
+            {
+                "title": "<Dune> & 'Messiah'",
+                "subtitle": "",
+                "author": str(self.author.pk),
+                "shelf": "3",
+                "plain": "7",
+            }
+        )
+        yield BookPlainForm({"title": "x" * 30, "author": "0", "shelf": "9"})
+
+    def Render(self, form: Form, fast: bool) -> List[str]:
+        with override_settings(NOMOS_BULMA_FAST_RENDER=fast):
+            return [form.as_bulma_v()] + [str(field) for field in form]
+
+    def test_fast_path_matches_templates(self) -> None:
+        renderers = (DjangoTemplates, AppDjangoTemplates)
+        for renderer_class, minify in itertools.product(
+            renderers, (False, True)
+        ):
+            with override_settings(NOMOS_TEMPLATE_MINIFY=minify):
+                renderer = renderer_class()
+            for i, form in enumerate(self.Forms()):
+                with self.subTest(renderer_class, minify=minify, form=i):
+                    form.renderer = renderer
+                    self.assertEqual(
+                        self.Render(form, True), self.Render(form, False)
+                    )
+
+    def test_fast_path_skips_templates(self) -> None:
+        render = mock.patch.object(
+            Template, "render", side_effect=AssertionError("template")
+        )
+        for renderer_class, minify in itertools.product(
+            (DjangoTemplates, AppDjangoTemplates), (False, True)
+        ):
+            with override_settings(NOMOS_TEMPLATE_MINIFY=minify):
+                renderer = renderer_class()
+            form = BookForm({"title": "Dune"}, renderer=renderer)
+            with self.subTest(renderer_class, minify=minify), render:
+                self.Render(form, True)
@@ -0,0 +1,37 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django.test import TestCase
+
+from nomos.core.cache import model_version
+from nomos.urls import menu_patterns
+from nomos.views.generic.menu import MenuTraits, ViewTraits
+from tests.demo.models import Author
+
+
+class CachedCountTrackingTests(TestCase):
+    def test_routing_tracks_model(self) -> None:
+        menu_patterns(
+            Author,
+            "demo",
+            "authors",
+            "tests",
+            menu_traits=MenuTraits(list=ViewTraits(count_strategy="cached")),
+        )
+        version = model_version(Author)
+        Author.objects.create(name="ann")
+        self.assertNotEqual(model_version(Author), version)
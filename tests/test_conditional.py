@@ -0,0 +1,56 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django.contrib.auth.models import Permission, User
+from django.test import RequestFactory, TestCase
+from django.views.generic import DetailView
+
+from nomos.views.generic.conditional import ConditionalMixin
+from tests.demo.models import Author, Book
+
+
+class BookDetail(ConditionalMixin, DetailView):  # type: ignore[misc]
+    model = Book
+    template_name = "demo/detail.html"
+    last_modified_field = "updated_at"
+
+
+class ConditionalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user("reader")
+        author = Author.objects.create(name="ann")
+        cls.book = Book.objects.create(title="Dune", author=author)
+
+    def ETag(self) -> str:
+        request = RequestFactory().get("/")
+        request.user = User.objects.get(pk=self.user.pk)
+        response = BookDetail.as_view()(request, pk=self.book.pk)
+        return str(response.headers["ETag"])
+
+    def test_etag_follows_permissions(self) -> None:
+        etag = self.ETag()
+        self.assertEqual(self.ETag(), etag)
+
+        self.user.last_name = "Reader"
+        self.user.save()
+        self.assertEqual(self.ETag(), etag)
+
+        self.user.user_permissions.add(
+            Permission.objects.get(codename="change_book")
+        )
+        self.assertNotEqual(self.ETag(), etag)
@@ -0,0 +1,53 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+from datetime import datetime, timezone
+
+from django.test import RequestFactory, TestCase
+
+from nomos.views.generic.bulk import ExportView
+from tests.demo.models import Author, Book
+
+
+class BookExport(ExportView):
+    model = Book
+    fields = ("title", "updated_at")
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        author = Author.objects.create(name="ann")
+        book = Book.objects.create(title="=HYPERLINK(1)", author=author)
+        cls.updated_at = datetime(
+            2024, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc
+        )
+        Book.objects.filter(pk=book.pk).update(updated_at=cls.updated_at)
+
+    def Export(self, export_format: str) -> str:
+        request = RequestFactory().get("/", {"format": export_format})
+        response = BookExport.as_view()(request)
+        return b"".join(response.streaming_content).decode()
+
+    def test_jsonl_keeps_microseconds(self) -> None:
+        row = json.loads(self.Export("jsonl"))
+        self.assertEqual(row["updated_at"], "2024-01-01T00:00:00.123456Z")
+
+    def test_csv_escapes_formulas(self) -> None:
+        lines = self.Export("csv").splitlines()
+        self.assertTrue(lines[1].startswith("'=HYPERLINK(1),"))
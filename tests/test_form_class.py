@@ -0,0 +1,70 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import gc
+import weakref
+from typing import Any
+
+from django import forms
+from django.db import models
+from django.test import RequestFactory
+
+from nomos.views.generic.edit import CreateView
+from tests.demo.models import Book
+
+
+class MethodCallbackView(CreateView):
+    model = Book
+    fields = ["title"]
+
+    def formfield_callback(self, field: models.Field[Any, Any]) -> forms.Field:
+        formfield = field.formfield()
+        formfield.help_text = type(self).__name__
+        return formfield
+
+
+def _form_class(view_class: type) -> Any:
+    view = view_class()
+    view.setup(RequestFactory().get("/"))
+    return view.get_form_class()
+
+
+def test_method_formfield_callback_is_bound() -> None:
+    form_class = _form_class(MethodCallbackView)
+    field = form_class.base_fields["title"]
+    assert field.help_text == "MethodCallbackView"
+
+
+def test_method_formfield_callback_is_cached() -> None:
+    assert _form_class(MethodCallbackView) is _form_class(MethodCallbackView)
+
+
+class NoRequestView(MethodCallbackView):
+    pass
+
+
+def test_cached_form_class_holds_no_request() -> None:
+    request = RequestFactory().get("/secret")
+    view = NoRequestView()
+    view.setup(request)
+    form_class = view.get_form_class()
+    request_ref = weakref.ref(request)
+    del view, request
+    gc.collect()
+
+    assert request_ref() is None
+    assert form_class.base_fields["title"].help_text == "NoRequestView"
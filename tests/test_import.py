@@ -0,0 +1,89 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any, List, Tuple
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, TestCase
+
+from nomos.core.cache import model_version
+from nomos.views.generic.bulk import ImportView
+from tests.demo.models import Tag
+
+
+class TagImport(ImportView):
+    model = Tag
+    template_name = "demo/import.html"
+    import_batch_size = 10
+
+
+class ImportTests(TestCase):
+    def Import(
+        self, content: bytes, view_class: type = TagImport
+    ) -> Tuple[int, int, List[Tuple[int, Any]]]:
+        upload = SimpleUploadedFile("tags.csv", content, "text/csv")
+        request = RequestFactory().post("/", {"file": upload})
+        response = view_class.as_view()(request)
+        report = response.context_data["import_report"]
+        return (
+            report.created,
+            report.failed,
+            [
+                (
+                    line,
+                    (
+                        error["__all__"][0]["message"]
+                        if "__all__" in error
+                        else sorted(error)
+                    ),
+                )
+                for line, error in report.errors
+            ],
+        )
+
+    def test_duplicates_in_upload_are_reported(self) -> None:
+        report = self.Import(b"name\na\nb\na\nc\n")
+        self.assertEqual(
+            report, (3, 1, [(4, "Violates a database constraint")])
+        )
+        self.assertEqual(
+            sorted(Tag.objects.values_list("name", flat=True)),
+            ["a", "b", "c"],
+        )
+
+    def test_undecodable_file_is_reported(self) -> None:
+        report = self.Import(b"name\na\n\xff\xfe\n")
+        self.assertEqual(report, (1, 1, [(3, "The file is not UTF-8 text")]))
+
+    def test_atomic_stops_at_first_invalid_row(self) -> None:
+        class AtomicTagImport(TagImport):
+            import_atomic = True
+
+        report = self.Import(b'name\na\n""\nb\n""\n', AtomicTagImport)
+        self.assertEqual(report, (0, 1, [(3, ["name"])]))
+        self.assertFalse(Tag.objects.exists())
+
+    def test_import_bumps_model_version(self) -> None:
+        version = model_version(Tag)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.Import(b"name\nx\n=y\n")
+        self.assertNotEqual(model_version(Tag), version)
+
+        version = model_version(Tag)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.Import(b"name\nx\n")
+        self.assertEqual(model_version(Tag), version)
@@ -0,0 +1,66 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from datetime import datetime, timedelta, timezone
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+
+from nomos.core.paginator import KeysetPaginator
+from tests.demo.models import Author, Book
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        author = Author.objects.create(name="ann")
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for i in range(6):
+            book = Book.objects.create(title=f"t{i}", author=author)
+            Book.objects.filter(pk=book.pk).update(
+                updated_at=start + timedelta(microseconds=100 * i)
+            )
+
+    def Walk(self, ordering: str) -> list[str]:
+        paginator = KeysetPaginator(Book.objects.all(), 2, (ordering,))
+        page = paginator.page()
+        titles = [book.title for book in page]
+        while page.has_next():
+            page = paginator.page(page.next_cursor)
+            titles.extend(book.title for book in page)
+            self.assertLess(len(titles), 10)
+        return titles
+
+    def test_microsecond_ascending(self) -> None:
+        self.assertEqual(self.Walk("updated_at"), [f"t{i}" for i in range(6)])
+
+    def test_microsecond_descending(self) -> None:
+        self.assertEqual(
+            self.Walk("-updated_at"), [f"t{i}" for i in reversed(range(6))]
+        )
+
+    def test_previous_page(self) -> None:
+        paginator = KeysetPaginator(Book.objects.all(), 2, ("updated_at",))
+        second = paginator.page(paginator.page().next_cursor)
+        first = paginator.page(second.previous_cursor)
+        self.assertEqual([book.title for book in first], ["t0", "t1"])
+
+    def test_unsupported_ordering(self) -> None:
+        for ordering in ("?", "author__name", "missing"):
+            with self.subTest(ordering=ordering):
+                with self.assertRaises(ImproperlyConfigured):
+                    KeysetPaginator(Book.objects.all(), 2, (ordering,))
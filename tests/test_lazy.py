@@ -0,0 +1,43 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import resolve
+
+
+class RouteCallbackTests(SimpleTestCase):
+    def test_csrf_exempt_is_kept(self) -> None:
+        for prefix in ("lazy", "eager", "alazy", "aeager"):
+            with self.subTest(prefix=prefix):
+                create = resolve(f"/{prefix}/create/").func
+                self.assertTrue(getattr(create, "csrf_exempt", False))
+                listing = resolve(f"/{prefix}/list/").func
+                self.assertFalse(getattr(listing, "csrf_exempt", False))
+
+    def test_eager_routes_are_as_view_functions(self) -> None:
+        for prefix in ("eager", "aeager"):
+            with self.subTest(prefix=prefix):
+                func = resolve(f"/{prefix}/list/").func
+                self.assertEqual(func.view_class.__name__, "BookListView")
+                self.assertEqual(func.view_initkwargs, {})
+
+
+class LazyRouteTests(TestCase):
+    def test_view_class_is_set_once_built(self) -> None:
+        self.assertEqual(self.client.get("/lazy/list/").status_code, 200)
+        func = resolve("/lazy/list/").func
+        self.assertEqual(func.view_class.__name__, "BookListView")
@@ -0,0 +1,93 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django import urls
+from django.template import Context, Template
+from django.test import SimpleTestCase, TestCase
+
+from nomos.views.generic.menu import PatternUrl, menu_context
+from tests.demo.models import Author, Book
+
+
+class PatternUrlTests(SimpleTestCase):
+    def tearDown(self) -> None:
+        urls.set_script_prefix("/")
+
+    def test_matches_reverse(self) -> None:
+        for name in ("tests:books:detail", "tests:abooks:update"):
+            pattern_url = PatternUrl(name)
+            for pk in (1, 42, "7"):
+                with self.subTest(name=name, pk=pk):
+                    self.assertEqual(
+                        pattern_url(pk), urls.reverse(name, args=[pk])
+                    )
+
+    def test_rejected_pk_falls_back_to_reverse(self) -> None:
+        pattern_url = PatternUrl("tests:books:detail")
+        self.assertEqual(pattern_url(3), "/books/3/detail/")
+        with self.assertRaises(urls.NoReverseMatch):
+            pattern_url("abc")
+
+    def test_unknown_name_raises(self) -> None:
+        with self.assertRaises(urls.NoReverseMatch):
+            PatternUrl("tests:missing:detail")(1)
+
+    def test_script_prefix_is_scoped(self) -> None:
+        pattern_url = PatternUrl("tests:books:delete")
+        self.assertEqual(pattern_url(1), "/books/1/delete/")
+        urls.set_script_prefix("/app/")
+        self.assertEqual(pattern_url(1), "/app/books/1/delete/")
+        urls.set_script_prefix("/")
+        self.assertEqual(pattern_url(2), "/books/2/delete/")
+
+    def test_nomos_url_filter(self) -> None:
+        template = Template("{{ menu.urls.detail|nomos_url:pk }}")
+        menu = menu_context("tests:books")
+        self.assertEqual(
+            template.render(Context({"menu": menu, "pk": 9})),
+            "/books/9/detail/",
+        )
+
+
+class MenuContextTests(TestCase):
+    def test_names_and_urls(self) -> None:
+        menu = menu_context("tests:abooks")
+        self.assertIs(menu, menu_context("tests:abooks"))
+        self.assertEqual(menu["list_name"], "tests:abooks:list")
+        self.assertEqual(menu["delete_name"], "tests:abooks:delete")
+        self.assertEqual(
+            [str(pattern_url) for pattern_url in menu["urls"]],
+            [
+                "tests:abooks:detail",
+                "tests:abooks:update",
+                "tests:abooks:delete",
+            ],
+        )
+        self.assertEqual(menu["urls"].update(5), "/abooks/5/update/")
+
+    def test_view_context(self) -> None:
+        author = Author.objects.create(name="Herbert")
+        Book.objects.create(title="Dune", author=author)
+        for prefix in ("lazy", "alazy"):
+            with self.subTest(prefix=prefix):
+                response = self.client.get(f"/{prefix}/list/")
+                self.assertEqual(response.status_code, 200)
+                menu = response.context["menu"]
+                self.assertEqual(menu["list_name"], f"tests:{prefix}:list")
+                self.assertEqual(
+                    menu["urls"].detail(1), f"/{prefix}/1/detail/"
+                )
@@ -0,0 +1,93 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+from django import forms
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.template import Context, Engine
+from django.test import SimpleTestCase, override_settings
+
+import nomos
+from nomos.contrib.bulma.forms import CharField, Form
+from nomos.forms.renderers import AppDjangoTemplates
+from nomos.template.loaders.minify import minify
+
+MODELS_TEMPLATES = Path(nomos.__file__).parent / "views/generic/templates"
+
+
+class FileForm(forms.Form):
+    name = forms.CharField()
+    attachment = forms.FileField(required=False)
+
+
+class BulmaForm(Form):
+    name = CharField()
+    title = CharField(required=False)
+
+
+class View:
+    fieldvalues = [("title", "Dune"), ("author", "Herbert")]
+    patterns = {"listurl": "/books/", "mainurl": "/"}
+
+
+def words(html: str) -> str:
+    return " ".join(html.split())
+
+
+class MinifyTests(SimpleTestCase):
+    def test_keeps_inline_tags_apart(self) -> None:
+        self.assertEqual(
+            minify("<a>Volver</a>\n<a>Actualizar</a>"),
+            "<a>Volver</a> <a>Actualizar</a>",
+        )
+
+    def test_models_templates(self) -> None:
+        context = {"view": View(), "object_list": ["Dune", "Emma"]}
+        for name in ("detail.html", "list.html", "main.html"):
+            with self.subTest(name):
+                source = (MODELS_TEMPLATES / "models" / name).read_text()
+                source = source.replace("{% url ", "{% firstof ")
+                plain = Engine().from_string(source)
+                minified = Engine().from_string(minify(source))
+                self.assertEqual(
+                    words(minified.render(Context(context))),
+                    words(plain.render(Context(context))),
+                )
+
+    def Render(self, form: forms.Form) -> str:
+        with override_settings(NOMOS_TEMPLATE_MINIFY=False):
+            form.renderer = AppDjangoTemplates()
+            plain = str(form)
+        with override_settings(NOMOS_TEMPLATE_MINIFY=True):
+            form.renderer = AppDjangoTemplates()
+            minified = str(form)
+        self.assertEqual(words(minified), words(plain))
+        return minified
+
+    def test_clearable_file_input(self) -> None:
+        initial = SimpleUploadedFile("notes.txt", b"")
+        initial.url = "/media/notes.txt"  # type: ignore[attr-defined]
+        html = self.Render(
+            FileForm(initial={"name": "Dune", "attachment": initial})
+        )
+        self.assertIn("</a> <input", html)
+        self.assertIn("Change: <input", html)
+
+    def test_bulma_form(self) -> None:
+        self.Render(BulmaForm({"name": "Dune"}))
+        self.Render(BulmaForm())
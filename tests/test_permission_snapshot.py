@@ -0,0 +1,72 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django.contrib.auth.models import Group, Permission, User
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from nomos.shortcuts import PermissionSnapshot, permissions_version
+
+
+@override_settings(NOMOS_PERMISSION_CACHE_TIMEOUT=60)
+class PermissionSnapshotTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user("reader")
+        self.group = Group.objects.create(name="readers")
+        self.view = Permission.objects.get(codename="view_book")
+
+    def Perms(self) -> frozenset:  # type: ignore[type-arg]
+        user = User.objects.get(pk=self.user.pk)
+        return PermissionSnapshot.Load(user).permissions
+
+    def test_user_save_keeps_version(self) -> None:
+        version = permissions_version()
+        self.user.last_login = timezone.now()
+        self.user.save(update_fields=["last_login"])
+        self.user.first_name = "Ana"
+        self.user.save()
+        self.assertEqual(permissions_version(), version)
+
+    def test_permission_changes(self) -> None:
+        self.assertEqual(self.Perms(), frozenset())
+
+        self.group.permissions.add(self.view)
+        self.user.groups.add(self.group)
+        self.assertEqual(self.Perms(), {"demo.view_book"})
+
+        self.group.permissions.remove(self.view)
+        self.assertEqual(self.Perms(), frozenset())
+
+        self.user.user_permissions.add(self.view)
+        self.assertEqual(self.Perms(), {"demo.view_book"})
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.Perms(), frozenset())
+
+    def test_group_delete(self) -> None:
+        self.group.permissions.add(self.view)
+        self.user.groups.add(self.group)
+        self.assertEqual(self.Perms(), {"demo.view_book"})
+        self.group.delete()
+        self.assertEqual(self.Perms(), frozenset())
+
+    def test_requires_nomos_app(self) -> None:
+        with self.modify_settings(INSTALLED_APPS={"remove": ["nomos"]}):
+            with self.assertRaises(ImproperlyConfigured):
+                self.Perms()
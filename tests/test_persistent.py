@@ -0,0 +1,63 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.template import Context, Engine
+from django.test import SimpleTestCase
+
+from nomos.template.loaders import persistent
+
+
+class PersistentLoaderTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.cache_dir = Path(tempfile.mkdtemp())
+        persistent._libraries_digest.cache_clear()
+        self.addCleanup(persistent._libraries_digest.cache_clear)
+
+    def Render(self) -> str:
+        engine = Engine(
+            loaders=[
+                (
+                    "nomos.template.loaders.persistent.Loader",
+                    [
+                        (
+                            "django.template.loaders.locmem.Loader",
+                            {"t.html": "{% if a %}{{ a }}{% endif %}"},
+                        )
+                    ],
+                    self.cache_dir,
+                )
+            ]
+        )
+        return engine.get_template("t.html").render(Context({"a": 1}))
+
+    def test_entries_are_reused(self) -> None:
+        self.assertEqual(self.Render(), "1")
+        self.assertEqual(self.Render(), "1")
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+
+    def test_nomos_upgrade_changes_the_key(self) -> None:
+        self.Render()
+        persistent._libraries_digest.cache_clear()
+        with mock.patch.object(
+            persistent.metadata, "version", return_value="99"
+        ):
+            self.assertEqual(self.Render(), "1")
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 2)
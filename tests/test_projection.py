@@ -0,0 +1,79 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any, Dict
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory, TestCase
+from django.views.generic import ListView
+
+from nomos.views.generic.list import KeysetPaginationMixin, MultipleObjectMixin
+from tests.demo.models import Author, Book
+
+
+class ProjectedBookList(MultipleObjectMixin, ListView):  # type: ignore[misc]
+    model = Book
+    fields = ("title", "author")
+    ordering = ["pk"]
+    project_fields = True
+    template_name = "demo/list.html"
+
+
+class KeysetProjectedBookList(KeysetPaginationMixin, ProjectedBookList):
+    pass
+
+
+class ProjectionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = Author.objects.create(name="Herbert")
+        cls.books = [
+            Book.objects.create(title=title, author=cls.author)
+            for title in ("Dune", "Messiah")
+        ]
+
+    def Context(self, view_class: type) -> Dict[str, Any]:
+        response = view_class.as_view()(RequestFactory().get("/"))
+        return dict(response.context_data)
+
+    def test_projected_items(self) -> None:
+        # count, values_list and the authors in bulk
+        with self.assertNumQueries(3):
+            context = self.Context(ProjectedBookList)
+        self.assertEqual(
+            [tuple(item) for item in context["object_items"]],
+            [
+                (self.books[0].pk, ("Dune", self.author)),
+                (self.books[1].pk, ("Messiah", self.author)),
+            ],
+        )
+
+    def test_projected_lookups(self) -> None:
+        view_class = type(
+            "LookupBookList",
+            (ProjectedBookList,),
+            {"projected_lookups": {"author": "author__name"}},
+        )
+        context = self.Context(view_class)
+        self.assertEqual(
+            [item.fields for item in context["object_items"]],
+            [("Dune", "Herbert"), ("Messiah", "Herbert")],
+        )
+
+    def test_keyset_pages_are_rejected(self) -> None:
+        with self.assertRaises(ImproperlyConfigured):
+            self.Context(KeysetProjectedBookList)
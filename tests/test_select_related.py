@@ -0,0 +1,68 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any
+
+from django.test import TestCase
+from django.views.generic import ListView
+
+from nomos.views.generic.base import RelatedQuerySetMixin
+from tests.demo.models import Author, Book, Review
+
+
+class BookList(RelatedQuerySetMixin, ListView):  # type: ignore[misc]
+    model = Book
+
+
+def _queryset(view_class: type, **initkwargs: Any) -> Any:
+    return view_class(**initkwargs).get_queryset()
+
+
+class SelectRelatedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        author = Author.objects.create(name="Herbert")
+        for title in ("Dune", "Messiah", "Children"):
+            book = Book.objects.create(title=title, author=author)
+            Review.objects.create(book=book)
+
+    def test_plan_follows_fields(self) -> None:
+        view = BookList()
+        self.assertEqual(view.PlanSelectRelated(Book), ("author",))
+        self.assertEqual(view.PlanSelectRelated(Review), ("book",))
+        view.fields = ["title"]  # type: ignore[attr-defined]
+        self.assertEqual(view.PlanSelectRelated(Book), ())
+
+    def test_planned_join_avoids_queries_per_row(self) -> None:
+        with self.assertNumQueries(1):
+            names = [book.author.name for book in _queryset(BookList)]
+        self.assertEqual(names, ["Herbert"] * 3)
+
+    def test_no_join_without_relations_shown(self) -> None:
+        queryset = _queryset(BookList, fields=["title"])
+        self.assertFalse(queryset.query.select_related)
+        with self.assertNumQueries(4):
+            [book.author.name for book in queryset]
+
+    def test_explicit_select_and_prefetch(self) -> None:
+        queryset = _queryset(
+            BookList, select_related=(), prefetch_related=["review_set"]
+        )
+        self.assertFalse(queryset.query.select_related)
+        with self.assertNumQueries(2):
+            reviews = [len(book.review_set.all()) for book in queryset]
+        self.assertEqual(reviews, [1, 1, 1])
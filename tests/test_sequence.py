@@ -0,0 +1,170 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any, List
+from unittest import mock
+
+from django import forms
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.models import signals
+from django.test import RequestFactory, TestCase, override_settings
+from django.views.generic.edit import CreateView
+
+from nomos.core.cache import model_version
+from nomos.core.sequence import (
+    CacheSequenceStorage,
+    DatabaseSequenceStorage,
+    SequenceExpired,
+    SessionSequenceStorage,
+    clear_expired_sequences,
+)
+from nomos.models import SequenceValue
+from nomos.views.generic.sequence import CompleteView, InlineSequence
+from tests.demo.models import Author, Book
+
+
+@override_settings(NOMOS_SEQUENCE_INLINE_MAX=64)
+class SessionSequenceStorageTests(TestCase):
+    def setUp(self) -> None:
+        self.request = RequestFactory().get("/")
+        self.request.session = SessionStore()
+
+    def Storage(self) -> SessionSequenceStorage:
+        return SessionSequenceStorage(self.request, "sequence", 60)
+
+    def test_spills_to_database(self) -> None:
+        self.Storage().Update(
+            {"title": "Dune", "body": "x" * 100, "cover": b"\x89PNG"}
+        )
+        self.assertEqual(
+            set(SequenceValue.objects.values_list("name", flat=True)),
+            {"body", "cover"},
+        )
+        self.assertEqual(
+            self.Storage().Load(),
+            {"title": "Dune", "body": "x" * 100, "cover": b"\x89PNG"},
+        )
+
+        storage = self.Storage()
+        storage.Update({"body": "short"})
+        self.assertEqual(self.Storage().Load()["body"], "short")
+
+        storage.Clear()
+        self.assertEqual(self.Storage().Load(), {})
+        self.assertFalse(SequenceValue.objects.exists())
+
+    def test_missing_spilled_value_raises(self) -> None:
+        self.Storage().Update({"body": "x" * 100})
+        clear_expired_sequences(-1)
+        with self.assertRaises(SequenceExpired):
+            self.Storage().Load()
+
+    def test_rejects_files(self) -> None:
+        upload = SimpleUploadedFile("cover.png", b"\x89PNG")
+        with self.assertRaises(TypeError):
+            self.Storage().Update({"cover": upload})
+        with self.assertRaises(TypeError):
+            self.Storage().Update({"key": lambda: None})
+        self.assertEqual(self.Storage().Load(), {})
+
+
+class SequenceStorageTests(TestCase):
+    def setUp(self) -> None:
+        self.request = RequestFactory().get("/")
+        self.request.session = SessionStore()
+
+    def test_session_keeps_large_values_by_default(self) -> None:
+        storage = SessionSequenceStorage(self.request, "sequence", 60)
+        storage.Update({"body": "x" * 4096})
+        self.assertEqual(self.request.session["sequence"]["body"], "x" * 4096)
+        self.assertFalse(SequenceValue.objects.exists())
+
+    def test_cache_renews_earlier_steps(self) -> None:
+        CacheSequenceStorage(self.request, "sequence", 60).Update({"a": 1})
+        with mock.patch.object(cache, "touch") as touch:
+            CacheSequenceStorage(self.request, "sequence", 60).Update({"b": 2})
+        touch.assert_called_once()
+        self.assertEqual(touch.call_args.args[0][-2:], ":a")
+
+    def test_cache_lost_value_raises(self) -> None:
+        storage = CacheSequenceStorage(self.request, "sequence", 60)
+        storage.Update({"a": 1, "b": 2})
+        sequence_id = self.request.session["sequence"]
+        cache.delete(f"nomos:seq:{sequence_id}:a")
+        with self.assertRaises(SequenceExpired):
+            CacheSequenceStorage(self.request, "sequence", 60).Load()
+
+    def test_database_without_upserts(self) -> None:
+        with mock.patch.object(
+            connection.features, "supports_update_conflicts_with_target", False
+        ):
+            for value in (1, 2):
+                DatabaseSequenceStorage(self.request, "sequence", 60).Update(
+                    {"a": value, "b": "b"}
+                )
+        self.assertEqual(
+            DatabaseSequenceStorage(self.request, "sequence", 60).Load(),
+            {"a": 2, "b": "b"},
+        )
+
+
+class AuthorForm(forms.ModelForm[Author]):
+    class Meta:
+        model = Author
+        fields = ["name"]
+
+
+class AuthorCompleteView(CompleteView, CreateView):  # type: ignore[misc]
+    form_class = AuthorForm
+    inlines = [InlineSequence(Book, "books", ["title"])]
+    success_url = "/done/"
+
+
+class CompleteViewTests(TestCase):
+    def testSavesParentOnce(self) -> None:
+        saves: List[Author] = []
+
+        def saved(instance: Author, **kwargs: Any) -> None:
+            saves.append(instance)
+
+        signals.post_save.connect(saved, sender=Author, weak=False)
+        self.addCleanup(signals.post_save.disconnect, saved, sender=Author)
+
+        request = RequestFactory().post("/", {"name": "Frank"})
+        request.session = SessionStore()
+        request.session["sequence"] = {"books": [{"title": "Dune"}]}
+        response = AuthorCompleteView.as_view()(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(len(saves), 1)
+        self.assertEqual(
+            list(Book.objects.values_list("author__name", "title")),
+            [("Frank", "Dune")],
+        )
+        self.assertNotIn("sequence", request.session)
+
+    def test_bumps_child_model_version(self) -> None:
+        version = model_version(Book)
+        request = RequestFactory().post("/", {"name": "Frank"})
+        request.session = SessionStore()
+        request.session["sequence"] = {"books": [{"title": "Dune"}]}
+        with self.captureOnCommitCallbacks(execute=True):
+            AuthorCompleteView.as_view()(request)
+        self.assertNotEqual(model_version(Book), version)
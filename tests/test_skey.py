@@ -0,0 +1,101 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.template import Context, Engine
+
+from nomos.template import defaulttags, manifest
+
+
+def test_hash_key_is_stable() -> None:
+    assert defaulttags.hash_key("name") == defaulttags.hash_key("name")
+    assert len(defaulttags.hash_key("name")) == defaulttags.SKEYLEN
+
+
+def test_no_collisions_in_many_names() -> None:
+    names = [f"field-{i}" for i in range(20000)]
+    assert manifest.hash_collisions(names) == []
+
+
+def test_collisions_are_reported() -> None:
+    with mock.patch.object(defaulttags, "SKEYLEN", 1):
+        collisions = manifest.hash_collisions(f"n{i}" for i in range(30))
+    assert collisions
+    assert all(len(group) > 1 for group in collisions)
+
+
+def test_sequence_keys() -> None:
+    keys = [defaulttags.sequence_key(i) for i in (0, 25, 26, 27, 701, 702)]
+    assert keys == ["a", "z", "aa", "ab", "zz", "aaa"]
+
+
+def _templates(tmp_path: Path) -> Path:
+    directory = tmp_path / "templates"
+    (directory / "app").mkdir(parents=True)
+    (directory / "app" / "a.html").write_text(
+        '{% nomos_sk "title" %}{% nomos_sk \'title\' %}{% nomos_sk "body" %}'
+    )
+    (directory / "b.html").write_text('{%nomos_sk "title"%}')
+    return directory
+
+
+def test_skmanifest_gives_short_keys_to_used_names(tmp_path: Path) -> None:
+    output = tmp_path / "out" / "skeys.json"
+    call_command("nomos_skmanifest", _templates(tmp_path), output=output)
+
+    assert json.loads(output.read_text()) == {"title": "a", "body": "b"}
+    assert manifest.load_manifest(output) == {"title": "a", "body": "b"}
+
+
+def test_skmanifest_needs_an_output(tmp_path: Path) -> None:
+    with pytest.raises(CommandError):
+        call_command("nomos_skmanifest", _templates(tmp_path), output=None)
+
+
+def test_skmanifest_rejects_hash_collisions(tmp_path: Path) -> None:
+    with mock.patch.object(defaulttags, "SKEYLEN", 0):
+        with pytest.raises(CommandError):
+            call_command(
+                "nomos_skmanifest",
+                _templates(tmp_path),
+                output=tmp_path / "skeys.json",
+            )
+
+
+def test_invalid_manifest(tmp_path: Path) -> None:
+    path = tmp_path / "skeys.json"
+    path.write_text("[]")
+    with pytest.raises(ValueError):
+        manifest.load_manifest(path)
+
+
+def test_manifest_keys_are_rendered() -> None:
+    template = Engine(builtins=["nomos.template.defaulttags"]).from_string(
+        '{% nomos_sk "title" %}-{% nomos_sk "other" %}'
+    )
+    defaulttags.skey.cache_clear()
+    try:
+        with mock.patch.dict(defaulttags.SKEYS, {"title": "a"}):
+            rendered = template.render(Context())
+    finally:
+        defaulttags.skey.cache_clear()
+    assert rendered == f"a-{defaulttags.hash_key('other')}"
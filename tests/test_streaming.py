@@ -0,0 +1,76 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Optional
+
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncRequestFactory, RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.views.generic import ListView
+
+from nomos.views.generic.asynchronous import AsyncListView
+from nomos.views.generic.list import StreamingListMixin
+from tests.demo.models import Author, Book
+
+
+class StreamingBookList(StreamingListMixin, ListView):
+    model = Book
+    template_name = "demo/stream.html"
+    stream_chunk_size = 2
+
+
+class AsyncStreamingBookList(StreamingListMixin, AsyncListView):
+    model = Book
+    ordering = ["pk"]
+    template_name = "demo/stream.html"
+    stream_chunk_size = 2
+
+
+class StreamingListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        author = Author.objects.create(name="ann")
+        Book.objects.bulk_create(
+            Book(title=f"t{i}", author=author) for i in range(5)
+        )
+
+    def test_rows_are_fetched_once(self) -> None:
+        view = StreamingBookList.as_view()
+        with CaptureQueriesContext(connection) as queries:
+            response = view(RequestFactory().get("/"))
+            content = b"".join(response.streaming_content)
+        self.assertEqual(content.decode().strip(), "t0,t1,t2,t3,t4,")
+        self.assertEqual(len(queries), 1)
+
+    def test_async_rows_are_fetched_once(self) -> None:
+        async def get(paginate_by: Optional[int]) -> bytes:
+            view = AsyncStreamingBookList.as_view(paginate_by=paginate_by)
+            response = await view(AsyncRequestFactory().get("/"))
+            self.assertTrue(response.is_async)
+            return b"".join(
+                [chunk async for chunk in response.streaming_content]
+            )
+
+        for paginate_by, expected, count in (
+            (None, "t0,t1,t2,t3,t4,", 1),
+            (3, "t0,t1,t2,", 2),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                content = async_to_sync(get)(paginate_by)
+            self.assertEqual(content.decode().strip(), expected)
+            self.assertEqual(len(queries), count)
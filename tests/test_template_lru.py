@@ -0,0 +1,71 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django.template import Engine
+from django.test import SimpleTestCase
+
+from nomos.template.cache import TemplateLRU
+
+
+class TemplateLRUTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.engine = Engine()
+        self.lru = TemplateLRU(maxsize=5)
+
+    def Get(self, source: str) -> object:
+        return self.lru.Get(self.engine, source)
+
+    def test_hit_returns_the_compiled_template(self) -> None:
+        template = self.Get("{{ a }}")
+        self.assertIs(self.Get("{{ a }}"), template)
+        self.assertEqual((self.lru.hits, self.lru.misses), (1, 1))
+
+    def test_probation_evicts_least_recent(self) -> None:
+        for i in range(6):
+            self.Get(f"s{i}")
+        self.assertEqual(len(self.lru), 5)
+        self.assertEqual(self.lru.evictions, 1)
+        self.Get("s0")
+        self.assertEqual(self.lru.misses, 7)
+
+    def test_second_hit_protects_from_one_off_sources(self) -> None:
+        hot = self.Get("hot")
+        self.Get("hot")
+        for i in range(20):
+            self.Get(f"once{i}")
+        self.assertIs(self.Get("hot"), hot)
+        self.assertEqual(self.lru.evictions, 16)
+
+    def test_protected_overflow_is_demoted(self) -> None:
+        for i in range(5):
+            self.Get(f"p{i}")
+            self.Get(f"p{i}")
+        # 4 protected, p0 demoted to probation
+        self.Get("new")
+        self.assertEqual(self.lru.evictions, 1)
+        misses = self.lru.misses
+        self.Get("p0")
+        self.assertEqual(self.lru.misses, misses + 1)
+        for i in range(1, 5):
+            self.Get(f"p{i}")
+        self.assertEqual(self.lru.misses, misses + 1)
+
+    def test_clear(self) -> None:
+        self.Get("a")
+        self.lru.Clear()
+        self.assertEqual(len(self.lru), 0)
+        self.assertEqual((self.lru.hits, self.lru.misses), (0, 0))
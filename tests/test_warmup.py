@@ -0,0 +1,47 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+import importlib
+
+from django.test import RequestFactory, SimpleTestCase
+
+import tests.urls
+from nomos.core.warmup import warmup_forms, warmup_views
+from nomos.views.generic.base import _form_classes
+from nomos.views.generic.menu import menuviews_registrations
+
+
+class RegistrationTests(SimpleTestCase):
+    def test_reimported_urlconf_replaces_registrations(self) -> None:
+        registrations = len(menuviews_registrations())
+        importlib.reload(tests.urls)
+        self.assertEqual(len(menuviews_registrations()), registrations)
+
+
+class WarmupFormsTests(SimpleTestCase):
+    def test_menu_form_classes_are_shared(self) -> None:
+        views = warmup_views()
+        self.assertGreater(warmup_forms(views), 0)
+        warmed = len(_form_classes)
+
+        for menu in views:
+            for view_class in (menu.create, menu.update):
+                view = view_class()
+                view.setup(RequestFactory().get("/"))
+                form_class = view.get_form_class()
+                self.assertIs(view.get_form_class(), form_class)
+        self.assertEqual(len(_form_classes), warmed)
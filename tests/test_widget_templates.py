@@ -0,0 +1,63 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django.forms.renderers import DjangoTemplates
+from django.test import SimpleTestCase
+
+from nomos.contrib.bulma.forms import TextInput
+from nomos.contrib.bulma.mixins import WidgetTemplateCache
+
+
+class LabelInput(TextInput):
+    pass
+
+
+class WidgetTemplateCacheTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.cache = WidgetTemplateCache()
+        self.engine = DjangoTemplates().engine
+
+    def test_hits_and_misses(self) -> None:
+        first = self.cache.Get(self.engine, TextInput, TextInput.template_str)
+        second = self.cache.Get(self.engine, TextInput, TextInput.template_str)
+        self.assertIs(first, second)
+        self.cache.Get(self.engine, LabelInput, LabelInput.template_str)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_changed_template_str_is_recompiled(self) -> None:
+        old = self.cache.Get(self.engine, LabelInput, "<b>{{ widget.name }}")
+        new = self.cache.Get(self.engine, LabelInput, "<i>{{ widget.name }}")
+        self.assertIsNot(new, old)
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(new.render({"widget": {"name": "n"}}), "<i>n")
+
+    def test_engines_are_kept_apart(self) -> None:
+        other = DjangoTemplates().engine
+        template = TextInput.template_str
+        self.assertIsNot(
+            self.cache.Get(self.engine, TextInput, template),
+            self.cache.Get(other, TextInput, template),
+        )
+
+    def test_clear(self) -> None:
+        self.cache.Get(self.engine, TextInput, TextInput.template_str)
+        self.cache.Clear()
+        self.assertEqual(
+            (len(self.cache), self.cache.hits, self.cache.misses), (0, 0, 0)
+        )
@@ -0,0 +1,89 @@
+# Copyright © 2023, Nomos-Team. All Rights Reserved.
+#
+# This file is part of Nomos.
+#
+# Nomos is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# Nomos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with Nomos. If not, see <https://www.gnu.org/licenses/>.
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.urls import include, path
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from django.views.generic.base import View
+
+from nomos.urls import menu_patterns
+from nomos.views.generic.base import PermissionSnapshotMixin
+from nomos.views.generic.menu import MenuTraits, ViewTraits
+from tests.demo.models import Book
+
+protected = ViewTraits(bases=(LoginRequiredMixin, PermissionSnapshotMixin))
+protected_traits = MenuTraits(
+    list=protected, create=protected, detail=protected
+)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class CsrfExemptMixin(View):
+    pass
+
+
+exempt_traits = MenuTraits(create=ViewTraits(bases=(CsrfExemptMixin,)))
+
+menus = [
+    path(
+        "books/",
+        include(
+            menu_patterns(
+                Book, "demo", "books", "tests", menu_traits=protected_traits
+            )
+        ),
+    ),
+    path(
+        "abooks/",
+        include(
+            menu_patterns(
+                Book,
+                "demo",
+                "abooks",
+                "tests",
+                menu_traits=protected_traits,
+                asynchronous=True,
+            )
+        ),
+    ),
+]
+
+for prefix, lazy, asynchronous in (
+    ("lazy", True, False),
+    ("eager", False, False),
+    ("alazy", True, True),
+    ("aeager", False, True),
+):
+    menus.append(
+        path(
+            f"{prefix}/",
+            include(
+                menu_patterns(
+                    Book,
+                    "demo",
+                    prefix,
+                    "tests",
+                    menu_traits=exempt_traits,
+                    asynchronous=asynchronous,
+                    lazy=lazy,
+                )
+            ),
+        )
+    )
+
+urlpatterns = [path("", include((menus, "tests")))]